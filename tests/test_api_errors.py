@@ -0,0 +1,65 @@
+"""
+Test suite for the JSON API error classes
+Validates status codes and bodies rendered by APIError.get_response
+"""
+
+import json
+import sys
+from pathlib import Path
+
+from flask import Flask
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from web.utils.errors import APIError, FileNotFoundAPIError, ValidationAPIError
+
+
+def _render(error):
+    response = error.get_response()
+    return response.status_code, response.mimetype, json.loads(response.get_data())
+
+
+class TestAPIErrorResponse:
+    """Test get_response for subclasses and the bare base class"""
+
+    def test_subclass_default_message(self):
+        status, mimetype, body = _render(FileNotFoundAPIError())
+
+        assert status == 404
+        assert mimetype == 'application/json'
+        assert body == {
+            'success': False,
+            'error': 'file_not_found',
+            'message': 'File not found or already cleaned up'
+        }
+
+    def test_subclass_custom_message(self):
+        status, _, body = _render(ValidationAPIError('Missing filename'))
+
+        assert status == 400
+        assert body == {'success': False, 'error': 'validation_error', 'message': 'Missing filename'}
+
+    def test_bare_api_error(self):
+        status, mimetype, body = _render(APIError())
+
+        assert status == 500
+        assert mimetype == 'application/json'
+        assert body == {
+            'success': False,
+            'error': 'internal_error',
+            'message': 'An internal error occurred'
+        }
+
+    def test_raised_from_view(self):
+        """Flask renders an unhandled APIError through get_response"""
+        app = Flask(__name__)
+
+        @app.route('/missing')
+        def missing():
+            raise FileNotFoundAPIError()
+
+        response = app.test_client().get('/missing')
+
+        assert response.status_code == 404
+        assert response.get_json()['error'] == 'file_not_found'
@@ -8,6 +8,7 @@ import io
 import pytest
 import tempfile
 import shutil
+import zipfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -26,6 +27,7 @@ from web.utils.file_validation import (
     is_file_size_valid,
     sanitize_filename,
     validate_upload_file,
+    validate_docx_one_pass,
     cleanup_file
 )
 
@@ -58,10 +60,10 @@ class TestFileValidation:
         assert filename1.endswith('.docx')
         assert filename2.endswith('.docx')
         
-        # Should be UUID format plus extension
+        # Should be UUID hex format plus extension
         name_part = filename1.replace('.docx', '')
-        assert len(name_part) == 36  # UUID length
-        assert name_part.count('-') == 4  # UUID has 4 dashes
+        assert len(name_part) == 32  # UUID hex length
+        assert all(c in '0123456789abcdef' for c in name_part)
     
     def test_is_file_size_valid(self):
         """Test file size validation"""
@@ -86,6 +88,73 @@ class TestFileValidation:
         sanitized = sanitize_filename(long_name)
         assert len(sanitized) <= 255
         assert sanitized.endswith('.docx')
+    
+    def test_validate_docx_one_pass(self):
+        """Test combined type and structure validation on a stream"""
+        def make_zip(parts):
+            buffer = io.BytesIO()
+            with zipfile.ZipFile(buffer, 'w') as zf:
+                for name, content in parts.items():
+                    zf.writestr(name, content)
+            buffer.seek(0)
+            return buffer
+        
+        valid = make_zip({
+            '[Content_Types].xml': '<Types/>',
+            '_rels/.rels': '<Relationships/>',
+            'word/document.xml': '<w:document/>'
+        })
+        assert validate_docx_one_pass(valid) == (True, "")
+        assert valid.tell() == 0
+        
+        missing_rels = make_zip({
+            '[Content_Types].xml': '<Types/>',
+            'word/document.xml': '<w:document/>'
+        })
+        assert validate_docx_one_pass(missing_rels) == (False, "Invalid DOCX file structure")
+        
+        plain_zip = make_zip({'notes.txt': 'hello'})
+        is_valid, error = validate_docx_one_pass(plain_zip)
+        assert not is_valid
+        assert "Invalid file format" in error
+        
+        assert validate_docx_one_pass(io.BytesIO(b'%PDF-1.4'))[0] is False
+    
+    @patch('web.utils.file_validation.validate_docx_one_pass')
+    def test_validate_upload_file_uses_one_pass_check(self, mock_one_pass):
+        """Test upload validation delegates content checks to validate_docx_one_pass"""
+        upload = FileStorage(stream=io.BytesIO(b'PK\x03\x04' + b'\x00' * 64), filename='test.docx')
+        
+        mock_one_pass.return_value = (True, "")
+        is_valid, _, file_info = validate_upload_file(upload, 1024)
+        assert is_valid
+        assert file_info['size'] == 68
+        mock_one_pass.assert_called_once_with(upload.stream)
+        
+        mock_one_pass.return_value = (False, "Invalid DOCX file structure")
+        assert validate_upload_file(upload, 1024) == (False, "Invalid DOCX file structure", None)
+    
+    def test_validate_docx_one_pass_non_seekable(self):
+        """Test non-seekable streams are buffered and not rewound"""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as zf:
+            zf.writestr('[Content_Types].xml', '<Types/>')
+            zf.writestr('_rels/.rels', '<Relationships/>')
+            zf.writestr('word/document.xml', '<w:document/>')
+        
+        class NonSeekableStream(io.RawIOBase):
+            def __init__(self, data):
+                self._source = io.BytesIO(data)
+            def readable(self):
+                return True
+            def seekable(self):
+                return False
+            def readinto(self, b):
+                return self._source.readinto(b)
+        
+        stream = NonSeekableStream(buffer.getvalue())
+        assert validate_docx_one_pass(stream) == (True, "")
+        assert stream.read() == b''
 
 class TestFileUploadAPI:
     """Test file upload API endpoints"""
@@ -93,7 +162,7 @@ class TestFileUploadAPI:
     @pytest.fixture
     def app(self):
         """Create test application"""
-        app = create_app(TestingConfig)
+        app, _ = create_app(TestingConfig)
         return app
     
     @pytest.fixture
@@ -125,7 +194,7 @@ class TestFileUploadAPI:
         
         data = response.get_json()
         assert data['success'] == False
-        assert 'No file provided' in data['message']
+        assert 'Please select a file to upload' in data['message']
     
     def test_upload_endpoint_empty_file(self, client):
         """Test upload endpoint with empty file field"""
@@ -135,18 +204,18 @@ class TestFileUploadAPI:
         data = response.get_json()
         assert data['success'] == False
     
-    @patch('web.utils.file_validation.validate_file_type_magic')
-    @patch('web.utils.file_validation.validate_docx_structure')
-    def test_upload_endpoint_valid_file(self, mock_validate_structure, mock_validate_magic, client, temp_dir):
+    @patch('web.utils.file_validation_refactored._validate_file_type')
+    @patch('web.utils.file_validation_refactored._validate_docx_structure')
+    def test_upload_endpoint_valid_file(self, mock_validate_structure, mock_validate_magic, app, client, temp_dir):
         """Test upload endpoint with valid DOCX file"""
-        # Mock the validation functions to return True
-        mock_validate_magic.return_value = True
-        mock_validate_structure.return_value = True
+        # Mock the content validators the upload endpoint runs to pass
+        mock_validate_magic.return_value = (True, "")
+        mock_validate_structure.return_value = (True, "")
         
         # Create test file
         file_content, filename = self.create_test_docx_file()
         
-        with patch('web.config.Config.UPLOAD_FOLDER', temp_dir):
+        with patch.dict(app.config, {'UPLOAD_FOLDER': temp_dir}):
             response = client.post('/api/v1/upload', data={
                 'file': (file_content, filename, 'application/vnd.openxmlformats-officedocument.wordprocessingml.document')
             })
@@ -174,10 +243,10 @@ class TestFileUploadAPI:
         assert data['success'] == False
         assert 'Invalid file type' in data['message']
     
-    @patch('web.utils.file_validation.validate_file_type_magic')
+    @patch('web.utils.file_validation_refactored._validate_file_type')
     def test_upload_endpoint_invalid_magic_type(self, mock_validate_magic, client):
         """Test upload endpoint with file that has correct extension but wrong magic type"""
-        mock_validate_magic.return_value = False
+        mock_validate_magic.return_value = (False, "Invalid file format. File does not appear to be a valid DOCX document")
         
         file_content, filename = self.create_test_docx_file()
         
@@ -191,12 +260,12 @@ class TestFileUploadAPI:
         assert data['success'] == False
         assert 'Invalid file format' in data['message']
     
-    @patch('web.utils.file_validation.validate_file_type_magic')
-    @patch('web.utils.file_validation.validate_docx_structure')
+    @patch('web.utils.file_validation_refactored._validate_file_type')
+    @patch('web.utils.file_validation_refactored._validate_docx_structure')
     def test_upload_endpoint_invalid_structure(self, mock_validate_structure, mock_validate_magic, client):
         """Test upload endpoint with file that has correct type but invalid DOCX structure"""
-        mock_validate_magic.return_value = True
-        mock_validate_structure.return_value = False
+        mock_validate_magic.return_value = (True, "")
+        mock_validate_structure.return_value = (False, "Invalid DOCX file structure")
         
         file_content, filename = self.create_test_docx_file()
         
@@ -240,18 +309,18 @@ class TestFileUploadAPI:
         assert data['success'] == False
         assert 'File is empty' in data['message']
     
-    @patch('web.utils.file_validation.validate_file_type_magic')
-    @patch('web.utils.file_validation.validate_docx_structure')
-    def test_cleanup_endpoint_success(self, mock_validate_structure, mock_validate_magic, client, temp_dir):
+    @patch('web.utils.file_validation_refactored._validate_file_type')
+    @patch('web.utils.file_validation_refactored._validate_docx_structure')
+    def test_cleanup_endpoint_success(self, mock_validate_structure, mock_validate_magic, app, client, temp_dir):
         """Test cleanup endpoint with valid file ID"""
         # Mock validations
-        mock_validate_magic.return_value = True
-        mock_validate_structure.return_value = True
+        mock_validate_magic.return_value = (True, "")
+        mock_validate_structure.return_value = (True, "")
         
         # First upload a file
         file_content, filename = self.create_test_docx_file()
         
-        with patch('web.config.Config.UPLOAD_FOLDER', temp_dir):
+        with patch.dict(app.config, {'UPLOAD_FOLDER': temp_dir}):
             upload_response = client.post('/api/v1/upload', data={
                 'file': (file_content, filename, 'application/vnd.openxmlformats-officedocument.wordprocessingml.document')
             })
@@ -275,11 +344,11 @@ class TestFileUploadAPI:
             # Verify file is removed
             assert not file_path.exists()
     
-    def test_cleanup_endpoint_file_not_found(self, client, temp_dir):
+    def test_cleanup_endpoint_file_not_found(self, app, client, temp_dir):
         """Test cleanup endpoint with non-existent file ID"""
         fake_file_id = "non-existent-file-id"
         
-        with patch('web.config.Config.UPLOAD_FOLDER', temp_dir):
+        with patch.dict(app.config, {'UPLOAD_FOLDER': temp_dir}):
             response = client.delete(f'/api/v1/upload/{fake_file_id}/cleanup')
             
             assert response.status_code == 404
@@ -294,7 +363,8 @@ class TestSecurityFeatures:
     @pytest.fixture
     def app(self):
         """Create test application"""
-        return create_app(TestingConfig)
+        app, _ = create_app(TestingConfig)
+        return app
     
     @pytest.fixture
     def client(self, app):
@@ -337,10 +407,10 @@ class TestSecurityFeatures:
             assert '\\' not in filename
             assert '..' not in filename
             
-            # Should be UUID format
+            # Should be UUID hex format
             name_part = filename.replace('.docx', '')
-            assert len(name_part) == 36
-            assert name_part.count('-') == 4
+            assert len(name_part) == 32
+            assert all(c in '0123456789abcdef' for c in name_part)
     
     def test_file_size_limit_enforcement(self, client):
         """Test that file size limits are properly enforced"""
@@ -362,7 +432,7 @@ class TestErrorHandling:
     @pytest.fixture
     def app(self):
         """Create test application"""
-        return create_app(TestingConfig)
+        return create_app(TestingConfig)[0]
     
     @pytest.fixture
     def client(self, app):
@@ -384,7 +454,7 @@ class TestErrorHandling:
         assert 'endpoints' in data
         assert '/api/v1/upload' in data['endpoints']['upload']
     
-    @patch('web.utils.file_validation.validate_upload_file')
+    @patch('web.api.upload.validate_upload_file')
     def test_validation_exception_handling(self, mock_validate, client):
         """Test handling of validation exceptions"""
         # Mock validation to raise an exception
@@ -398,7 +468,7 @@ class TestErrorHandling:
         assert response.status_code == 500
         data = response.get_json()
         assert data['success'] == False
-        assert 'Internal server error' in data['error']
+        assert data['error'] == 'internal_error'
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
\ No newline at end of file
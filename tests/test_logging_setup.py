@@ -0,0 +1,87 @@
+"""
+Test suite for the application logging setup
+Validates queued root logging and that foreign handlers are left alone
+"""
+
+import io
+import logging
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from web.utils import logging_setup
+from web.utils.logging_setup import configure_logging
+
+
+class _ListHandler(logging.Handler):
+    """Collects formatted messages"""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestConfigureLogging(unittest.TestCase):
+    """Test configure_logging queue routing on the root logger"""
+
+    def setUp(self):
+        self.root = logging.getLogger()
+        self.saved_handlers = list(self.root.handlers)
+        self.saved_level = self.root.level
+        for handler in self.saved_handlers:
+            self.root.removeHandler(handler)
+        self.saved_state = (logging_setup._log_listener, logging_setup._queue_handler)
+        logging_setup._log_listener = None
+        logging_setup._queue_handler = None
+
+    def tearDown(self):
+        logging_setup._stop_listener()
+        for handler in list(self.root.handlers):
+            self.root.removeHandler(handler)
+        for handler in self.saved_handlers:
+            self.root.addHandler(handler)
+        self.root.setLevel(self.saved_level)
+        logging_setup._log_listener, logging_setup._queue_handler = self.saved_state
+
+    def test_tracker_records_reach_app_handler(self):
+        """Records from the tracker components are written through the queue"""
+        stream = io.StringIO()
+        configure_logging(stream=stream)
+        self.assertEqual(self.root.handlers, [logging_setup._queue_handler])
+
+        tracker_logger = logging.getLogger('web.services.job_state_manager')
+        tracker_logger.info("queued record")
+        logging_setup._stop_listener()
+
+        self.assertIn("web.services.job_state_manager - INFO - queued record", stream.getvalue())
+
+    def test_repeated_calls_install_once(self):
+        configure_logging(stream=io.StringIO())
+        listener = logging_setup._log_listener
+        configure_logging(stream=io.StringIO())
+
+        self.assertIs(logging_setup._log_listener, listener)
+        self.assertEqual(len(self.root.handlers), 1)
+
+    def test_existing_handlers_left_untouched(self):
+        """Handlers installed by others (e.g. pytest caplog) keep receiving records directly"""
+        foreign = _ListHandler()
+        self.root.addHandler(foreign)
+        self.root.setLevel(logging.INFO)
+
+        configure_logging(stream=io.StringIO())
+        logging.getLogger('web.services.job_state_manager').info("direct record")
+
+        self.assertEqual(self.root.handlers, [foreign])
+        self.assertIsNone(logging_setup._log_listener)
+        self.assertIn("direct record", foreign.messages)
+
+
+if __name__ == '__main__':
+    unittest.main()
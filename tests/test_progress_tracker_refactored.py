@@ -0,0 +1,219 @@
+"""
+Test suite for the refactored web ProgressTracker components
+Validates job state handling and WebSocket broadcasting with a mocked emitter
+"""
+
+import subprocess
+import unittest
+from unittest.mock import Mock
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from web.services.job_state_manager import JobStateManager
+from web.services.progress_calculator import ProgressCalculator
+from web.services.progress_tracker_refactored import ProgressTracker
+
+
+class TestJobStateManager(unittest.TestCase):
+    """Test JobStateManager component"""
+
+    def setUp(self):
+        self.manager = JobStateManager()
+        self.stages = ["parsing", "analyzing", "integrating"]
+
+    def test_create_job_caches_room(self):
+        """Room name is computed once when the job is created"""
+        job_info = self.manager.create_job("job-1", self.stages)
+        self.assertEqual(job_info['room'], "job_job-1")
+
+    def test_advance_stage(self):
+        """Completing a stage moves the job to the following stage"""
+        self.manager.create_job("job-1", self.stages)
+        self.assertEqual(self.manager.advance_stage("job-1", "analyzing"), "integrating")
+        self.assertEqual(self.manager.get_job("job-1")['current_stage_index'], 2)
+        self.assertIsNone(self.manager.advance_stage("job-1", "integrating"))
+        self.assertIsNone(self.manager.advance_stage("job-1", "unknown"))
+
+    def test_serializable_status(self):
+        """Status view holds ISO timestamps and omits internal caches"""
+        self.manager.create_job("job-1", self.stages)
+        status = self.manager.get_job_serializable("job-1")
+
+        self.assertIsInstance(status['start_time'], str)
+        self.assertIsNone(status['end_time'])
+        self.assertEqual(status['current_stage'], "parsing")
+        self.assertNotIn('stage_index', status)
+        self.assertNotIn('start_ts', status)
+        self.assertIsNone(self.manager.get_job_serializable("missing"))
+
+    def test_job_map_is_copy_on_write(self):
+        """Readers holding a snapshot are unaffected by later writes"""
+        self.manager.create_job("job-1", self.stages)
+        snapshot = self.manager.active_jobs
+
+        self.manager.create_job("job-2", self.stages)
+        self.manager.remove_job("job-1")
+
+        self.assertEqual(list(snapshot), ["job-1"])
+        self.assertEqual(self.manager.get_active_job_ids(), ["job-2"])
+        self.assertFalse(self.manager.remove_job("job-1"))
+
+
+class TestProgressCalculator(unittest.TestCase):
+    """Test ProgressCalculator component"""
+
+    def setUp(self):
+        self.calculator = ProgressCalculator()
+        self.job_info = JobStateManager().create_job("job-1", ["parsing"])
+
+    def test_elapsed_seconds(self):
+        """Elapsed time is measured from job start to the last update"""
+        self.job_info['last_update_ts'] = self.job_info['start_ts'] + 10.0
+        self.assertEqual(self.calculator.calculate_elapsed_seconds(self.job_info), 10.0)
+
+
+class _FakeManager:
+    """Socket.IO manager stand-in with a fixed set of room participants"""
+
+    def __init__(self, count):
+        self.sids = [f"sid-{i}" for i in range(count)]
+        self.lookups = 0
+
+    def get_participants(self, namespace, room):
+        self.lookups += 1
+        return ((sid, f"eio-{sid}") for sid in self.sids)
+
+
+class TestProgressTrackerBroadcasting(unittest.TestCase):
+    """Test ProgressTracker broadcasting through a mocked emitter"""
+
+    def setUp(self):
+        self.socketio = Mock()
+        self.tracker = ProgressTracker(self.socketio)
+        self.stages = ["parsing", "analyzing", "integrating"]
+
+    def test_events_use_job_room(self):
+        """All job events are emitted to the job-specific room"""
+        self.tracker.start_job("job-1", self.stages)
+        self.tracker.update_progress("job-1", "parsing", 10, "Parsing document")
+        self.tracker.complete_stage("job-1", "parsing")
+        self.tracker.complete_job("job-1", True)
+
+        rooms = [call.kwargs['room'] for call in self.socketio.emit.call_args_list]
+        self.assertEqual(len(rooms), 4)
+        self.assertTrue(all(room == "job_job-1" for room in rooms))
+
+    def test_job_started_payload(self):
+        """job_started emits the payload prebuilt at job creation"""
+        self.tracker.start_job("job-1", self.stages, estimated_duration=30)
+
+        event, data = self.socketio.emit.call_args.args
+        self.assertEqual(event, 'job_started')
+        self.assertIs(data, self.tracker.state_manager.get_job("job-1")['started_payload'])
+        self.assertEqual(data['stages'], self.stages)
+        self.assertEqual(data['estimated_duration'], 30)
+        self.assertEqual(data['status'], 'started')
+
+    def test_progress_update_carries_elapsed_seconds(self):
+        """progress_update sends numeric elapsed time instead of a formatted estimate"""
+        self.tracker.start_job("job-1", self.stages)
+        self.tracker.update_progress("job-1", "parsing", 10, "Parsing document")
+
+        event, data = self.socketio.emit.call_args.args
+        self.assertEqual(event, 'progress_update')
+        self.assertIsInstance(data['elapsed_s'], float)
+        self.assertNotIn('estimated_remaining', data)
+
+    def test_unknown_job_failure_still_broadcast(self):
+        """Failures for unknown jobs fall back to the derived room name"""
+        self.tracker.fail_job("missing", "boom")
+
+        event, data = self.socketio.emit.call_args.args
+        self.assertEqual(event, 'job_failed')
+        self.assertEqual(self.socketio.emit.call_args.kwargs['room'], "job_missing")
+
+    def test_skips_emit_without_subscribers(self):
+        """Events for rooms without participants are not serialized"""
+        from socketio import Manager
+        manager = Manager()
+        self.socketio.server.manager = manager
+
+        self.tracker.start_job("job-1", self.stages)
+        self.socketio.emit.assert_not_called()
+
+        manager.basic_enter_room("sid-1", "/", "job_job-1", eio_sid="eio-1")
+        self.tracker.update_progress("job-1", "parsing", 10, "Parsing document")
+        self.assertEqual(self.socketio.emit.call_count, 1)
+
+    def test_large_rooms_emitted_in_batches(self):
+        """Large rooms are emitted to in slices with a yield between slices"""
+        from socketio import Manager
+        manager = Manager()
+        self.socketio.server.manager = manager
+        for i in range(120):
+            manager.basic_enter_room(f"sid-{i}", "/", "job_job-1", eio_sid=f"eio-{i}")
+
+        self.tracker.start_job("job-1", self.stages)
+
+        batches = [call.kwargs['to'] for call in self.socketio.emit.call_args_list]
+        self.assertEqual([len(batch) for batch in batches], [50, 50, 20])
+        self.assertEqual(self.socketio.sleep.call_count, 2)
+
+    def test_rooms_at_batch_size_use_single_emit(self):
+        """Rooms up to the batch size get one room emit without yielding"""
+        self.socketio.server.manager = _FakeManager(50)
+
+        self.tracker.start_job("job-1", self.stages)
+
+        self.assertEqual(self.socketio.emit.call_count, 1)
+        self.assertEqual(self.socketio.emit.call_args.kwargs, {'room': "job_job-1"})
+        self.socketio.sleep.assert_not_called()
+
+    def test_fake_manager_rooms_split_into_batches(self):
+        """Participants above the batch size are sent in slices of at most 50"""
+        manager = _FakeManager(51)
+        self.socketio.server.manager = manager
+
+        self.tracker.start_job("job-1", self.stages)
+
+        batches = [call.kwargs['to'] for call in self.socketio.emit.call_args_list]
+        self.assertEqual(batches, [manager.sids[:50], manager.sids[50:]])
+        self.assertEqual(self.socketio.sleep.call_count, 1)
+
+    def test_pubsub_manager_falls_back_to_room_emit(self):
+        """Message-queue managers only know local participants, so emit to the room"""
+        manager = _FakeManager(120)
+        manager.channel = 'socketio'
+        self.socketio.server.manager = manager
+
+        self.tracker.start_job("job-1", self.stages)
+
+        self.assertEqual(self.socketio.emit.call_count, 1)
+        self.assertEqual(self.socketio.emit.call_args.kwargs, {'room': "job_job-1"})
+        self.assertEqual(manager.lookups, 0)
+
+
+class TestProgressTrackerSingleton(unittest.TestCase):
+    """Test lazy creation of the shared progress tracker"""
+
+    def test_import_does_not_load_socketio(self):
+        """Flask-SocketIO is only imported once a tracker is requested"""
+        script = (
+            "import sys\n"
+            "from web.services import progress_tracker_refactored as module\n"
+            "assert module._progress_tracker_instance is None\n"
+            "assert 'flask_socketio' not in sys.modules\n"
+            "tracker = module.get_progress_tracker()\n"
+            "assert module.get_progress_tracker() is tracker\n"
+            "assert 'flask_socketio' in sys.modules\n"
+        )
+        result = subprocess.run([sys.executable, '-c', script], cwd=str(Path(__file__).parent.parent),
+                                capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
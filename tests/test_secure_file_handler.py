@@ -0,0 +1,291 @@
+"""
+Test suite for SecureFileHandler
+Covers verified copies, moves, sandboxed path validation, cleanup and caching
+"""
+
+import os
+import sys
+import time
+import errno
+import zlib
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import web.utils.secure_file_handler as sfh
+from web.utils.secure_file_handler import SecureFileHandler, create_secure_handler
+
+
+@pytest.fixture
+def workspace():
+    """Sandbox directory plus a sibling directory outside of it"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        sandbox = root / 'uploads'
+        outside = root / 'elsewhere'
+        sandbox.mkdir()
+        outside.mkdir()
+        yield sandbox, outside
+
+
+@pytest.fixture
+def handler(workspace):
+    return SecureFileHandler(str(workspace[0]))
+
+
+def _write(path, data=b'PK\x03\x04' + os.urandom(64 * 1024)):
+    path.write_bytes(data)
+    return data
+
+
+def _crc(data):
+    return f"{zlib.crc32(data):08x}"
+
+
+class TestVerifiedCopy:
+    """Test _verified_copy with kernel and user-space copy paths"""
+
+    def test_kernel_copy(self, workspace):
+        """In-kernel copy moves the data without re-reading it for a checksum"""
+        sandbox, outside = workspace
+        data = _write(outside / 'source.docx')
+
+        def fd_copier(src_fd, dst_fd, count):
+            return os.write(dst_fd, os.read(src_fd, count))
+
+        with patch.object(sfh, '_KERNEL_COPIERS', [fd_copier]), \
+             patch.object(sfh, '_copy_and_hash') as user_copy:
+            digest = sfh._verified_copy(str(outside / 'source.docx'), str(sandbox / 'copy.docx'))
+
+        user_copy.assert_not_called()
+        assert digest is None
+        assert (sandbox / 'copy.docx').read_bytes() == data
+
+    def test_unsupported_kernel_copy_falls_back(self, workspace):
+        """Copiers failing with ENOSYS before writing fall back to user space"""
+        sandbox, outside = workspace
+        data = _write(outside / 'source.docx')
+
+        def unsupported(src_fd, dst_fd, count):
+            raise OSError(errno.ENOSYS, 'not supported')
+
+        with patch.object(sfh, '_KERNEL_COPIERS', [unsupported]), \
+             patch.object(sfh, '_copy_and_hash', wraps=sfh._copy_and_hash) as user_copy:
+            digest = sfh._verified_copy(str(outside / 'source.docx'), str(sandbox / 'copy.docx'))
+
+        user_copy.assert_called_once()
+        assert digest == _crc(data)
+        assert (sandbox / 'copy.docx').read_bytes() == data
+
+    def test_kernel_copy_io_error_propagates(self, workspace):
+        """Genuine I/O errors are raised instead of silently retried"""
+        sandbox, outside = workspace
+        _write(outside / 'source.docx')
+
+        def failing(src_fd, dst_fd, count):
+            raise OSError(errno.EIO, 'I/O error')
+
+        with patch.object(sfh, '_KERNEL_COPIERS', [failing]):
+            with pytest.raises(OSError):
+                sfh._verified_copy(str(outside / 'source.docx'), str(sandbox / 'copy.docx'))
+
+    def test_size_mismatch_raises_and_removes_destination(self, workspace):
+        """A short destination fails the integrity check and is removed"""
+        sandbox, outside = workspace
+        data = _write(outside / 'source.docx')
+        destination = sandbox / 'copy.docx'
+
+        def truncated_copy(source_path, destination_path):
+            Path(destination_path).write_bytes(data[:100])
+            return len(data)
+
+        with patch.object(sfh, '_kernel_copy', truncated_copy):
+            with pytest.raises(OSError, match='integrity check failed'):
+                sfh._verified_copy(str(outside / 'source.docx'), str(destination))
+
+        assert not destination.exists()
+
+    def test_tampered_destination_raises(self, workspace):
+        """Bytes appended to the destination after copying are detected"""
+        sandbox, outside = workspace
+        _write(outside / 'source.docx')
+        destination = sandbox / 'copy.docx'
+        real_copy = sfh._copy_and_hash
+
+        def tampering_copy(source_path, destination_path):
+            result = real_copy(source_path, destination_path)
+            with open(destination_path, 'ab') as f:
+                f.write(b'tampered')
+            return result
+
+        with patch.object(sfh, '_kernel_copy', return_value=None), \
+             patch.object(sfh, '_copy_and_hash', tampering_copy):
+            with pytest.raises(OSError, match='integrity check failed'):
+                sfh._verified_copy(str(outside / 'source.docx'), str(destination))
+
+        assert not destination.exists()
+
+
+class TestSecureFileMove:
+    """Test secure_file_move rename and copy paths"""
+
+    def test_same_device_rename(self, handler, workspace):
+        sandbox, outside = workspace
+        data = _write(outside / 'source.docx')
+
+        assert handler.secure_file_move(str(outside / 'source.docx'), str(sandbox / 'moved.docx'))
+        assert not (outside / 'source.docx').exists()
+        assert (sandbox / 'moved.docx').read_bytes() == data
+
+    def test_exdev_rename_falls_back_to_copy(self, handler, workspace):
+        """Rename refused across bind mounts still moves the file"""
+        sandbox, outside = workspace
+        data = _write(outside / 'source.docx')
+
+        with patch.object(sfh.os, 'replace', side_effect=OSError(errno.EXDEV, 'cross-device link')):
+            assert handler.secure_file_move(str(outside / 'source.docx'), str(sandbox / 'moved.docx'))
+
+        assert not (outside / 'source.docx').exists()
+        assert (sandbox / 'moved.docx').read_bytes() == data
+
+    def test_missing_source(self, handler, workspace):
+        sandbox, outside = workspace
+        assert not handler.secure_file_move(str(outside / 'missing.docx'), str(sandbox / 'moved.docx'))
+
+
+class TestValidateFilePath:
+    """Test realpath-based sandbox validation"""
+
+    def test_file_inside_sandbox(self, handler, workspace):
+        assert handler.validate_file_path(str(workspace[0] / 'doc.docx'))
+
+    def test_traversal_rejected(self, handler, workspace):
+        assert not handler.validate_file_path(str(workspace[0] / '..' / 'elsewhere' / 'doc.docx'))
+
+    def test_sibling_with_common_prefix_rejected(self, handler, workspace):
+        """'uploads2' must not pass as being inside 'uploads'"""
+        sibling = workspace[0].parent / 'uploads2'
+        sibling.mkdir()
+        assert not handler.validate_file_path(str(sibling / 'doc.docx'))
+
+    def test_symlink_escaping_sandbox_rejected(self, handler, workspace):
+        sandbox, outside = workspace
+        _write(outside / 'target.docx')
+        os.symlink(outside / 'target.docx', sandbox / 'link.docx')
+        assert not handler.validate_file_path(str(sandbox / 'link.docx'))
+
+    def test_symlink_to_disallowed_extension_rejected(self, handler, workspace):
+        sandbox = workspace[0]
+        (sandbox / 'notes.txt').write_text('text')
+        os.symlink(sandbox / 'notes.txt', sandbox / 'link.docx')
+        assert not handler.validate_file_path(str(sandbox / 'link.docx'))
+
+    def test_disallowed_extension_rejected(self, handler, workspace):
+        assert not handler.validate_file_path(str(workspace[0] / 'script.py'))
+
+
+class TestCleanupOldFiles:
+    """Test scandir-based cleanup with concurrent unlinking"""
+
+    def _age(self, path, hours=48):
+        old = time.time() - hours * 3600
+        os.utime(path, (old, old))
+
+    def test_removes_only_expired_docx(self, handler, workspace):
+        sandbox, outside = workspace
+        nested = sandbox / 'nested'
+        nested.mkdir()
+
+        expired = [sandbox / f'old{i}.docx' for i in range(5)] + [nested / 'old.docx']
+        for path in expired:
+            _write(path)
+            self._age(path)
+
+        fresh = sandbox / 'fresh.docx'
+        _write(fresh)
+        old_text = sandbox / 'old.txt'
+        old_text.write_text('keep')
+        self._age(old_text)
+
+        # Expired target outside the sandbox, reachable only through a symlink
+        _write(outside / 'target.docx')
+        self._age(outside / 'target.docx')
+        os.symlink(outside / 'target.docx', sandbox / 'link.docx')
+
+        assert handler.cleanup_old_files(max_age_hours=24) == len(expired)
+
+        assert not any(path.exists() for path in expired)
+        assert fresh.exists()
+        assert old_text.exists()
+        assert os.path.islink(sandbox / 'link.docx')
+        assert (outside / 'target.docx').exists()
+
+    def test_scan_skips_symlinks_and_other_extensions(self, handler, workspace):
+        sandbox, outside = workspace
+        _write(sandbox / 'a.docx')
+        (sandbox / 'b.txt').write_text('skip')
+        os.symlink(outside, sandbox / 'linked_dir')
+        _write(outside / 'c.docx')
+
+        assert [entry.name for entry in handler._scan_files()] == ['a.docx']
+
+    def test_unlink_expired_missing_file(self, workspace):
+        assert sfh._unlink_expired((str(workspace[0] / 'gone.docx'), 0)) is False
+
+
+class TestFileInfoHashCache:
+    """Test the identity-keyed hash cache behind get_file_info"""
+
+    def setup_method(self):
+        sfh._cached_file_hash.cache_clear()
+
+    def test_unchanged_file_is_not_rehashed(self, handler, workspace):
+        path = workspace[0] / 'doc.docx'
+        _write(path)
+
+        with patch.object(sfh, '_sha256_file', wraps=sfh._sha256_file) as hasher:
+            first = handler.get_file_info(str(path))
+            second = handler.get_file_info(str(path))
+
+        assert hasher.call_count == 1
+        assert first['sha256'] == second['sha256']
+
+    def test_modified_file_is_rehashed(self, handler, workspace):
+        path = workspace[0] / 'doc.docx'
+        _write(path, b'first version')
+        first = handler.get_file_info(str(path))['sha256']
+
+        _write(path, b'second, longer version')
+        second = handler.get_file_info(str(path))['sha256']
+
+        assert first != second
+        assert second == handler.calculate_file_hash(str(path))
+
+
+class TestCreateSecureHandler:
+    """Test per-app caching of secure handlers"""
+
+    def _app(self, upload_dir):
+        app = Flask(__name__)
+        app.config['UPLOAD_FOLDER'] = str(upload_dir)
+        return app
+
+    def test_handler_shared_within_app(self, workspace):
+        app = self._app(workspace[0])
+        with app.app_context():
+            handler = create_secure_handler('uploads')
+            assert create_secure_handler('uploads') is handler
+            assert handler.base_directory == workspace[0].resolve()
+
+    def test_handlers_not_shared_across_apps(self, workspace):
+        with self._app(workspace[0]).app_context():
+            first = create_secure_handler('uploads')
+        with self._app(workspace[0]).app_context():
+            second = create_secure_handler('uploads')
+        assert first is not second
@@ -0,0 +1,76 @@
+"""
+Test suite for WebSocket connection rate limiting
+Validates the sliding window and the sweep of idle clients
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from web.websocket import progress
+from web.websocket.progress import check_rate_limit
+
+
+class TestCheckRateLimit(unittest.TestCase):
+    """Test check_rate_limit with a controlled clock"""
+
+    def setUp(self):
+        self.now = 1000.0
+        clock = patch.object(progress.time, 'time', side_effect=lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+        attempts = patch.object(progress, '_connection_attempts', {})
+        attempts.start()
+        self.addCleanup(attempts.stop)
+
+        sweep = patch.object(progress, '_last_rate_limit_sweep', self.now)
+        sweep.start()
+        self.addCleanup(sweep.stop)
+
+    def test_limit_reached(self):
+        """Attempts beyond max_attempts within the window are refused"""
+        for _ in range(3):
+            self.assertTrue(check_rate_limit('client-1', max_attempts=3, window_seconds=60))
+
+        self.assertFalse(check_rate_limit('client-1', max_attempts=3, window_seconds=60))
+        self.assertTrue(check_rate_limit('client-2', max_attempts=3, window_seconds=60))
+        self.assertEqual(len(progress._connection_attempts['client-1']), 3)
+
+    def test_old_attempts_expire(self):
+        """Attempts older than the window no longer count against the client"""
+        for _ in range(3):
+            check_rate_limit('client-1', max_attempts=3, window_seconds=60)
+        self.now += 30
+        self.assertFalse(check_rate_limit('client-1', max_attempts=3, window_seconds=60))
+
+        self.now += 30
+        self.assertTrue(check_rate_limit('client-1', max_attempts=3, window_seconds=60))
+        self.assertEqual(list(progress._connection_attempts['client-1']), [self.now])
+
+    def test_sweep_removes_idle_clients(self):
+        """Clients idle for a full window are dropped once the sweep interval passes"""
+        check_rate_limit('idle', window_seconds=60)
+        self.now += 30
+        check_rate_limit('active', window_seconds=60)
+
+        self.now += progress._RATE_LIMIT_SWEEP_INTERVAL - 30
+        check_rate_limit('active', window_seconds=60)
+        self.assertNotIn('idle', progress._connection_attempts)
+        self.assertIn('active', progress._connection_attempts)
+        self.assertEqual(progress._last_rate_limit_sweep, self.now)
+
+    def test_no_sweep_before_interval(self):
+        check_rate_limit('idle', window_seconds=10)
+        self.now += 20
+        check_rate_limit('other', window_seconds=10)
+
+        self.assertIn('idle', progress._connection_attempts)
+
+
+if __name__ == '__main__':
+    unittest.main()
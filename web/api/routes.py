@@ -17,7 +17,7 @@ def api_info():
         'name': APIConfig.API_NAME,
         'version': APIConfig.API_VERSION,
         'description': APIConfig.API_DESCRIPTION,
-        'endpoints': APIConfig.ENDPOINTS
+        'endpoints': dict(APIConfig.ENDPOINTS)
     })
 
 # File upload endpoints
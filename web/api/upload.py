@@ -7,10 +7,16 @@ import os
 import logging
 from flask import request, current_app
 from pathlib import Path
+from werkzeug.exceptions import RequestEntityTooLarge
 
 from web.utils.file_validation_refactored import validate_upload_file, cleanup_file
-from web.utils.errors import ValidationError, FileProcessingError
+from web.utils.errors import (
+    ValidationError, FileProcessingError,
+    ValidationAPIError, ProcessingAPIError, InternalAPIError,
+    FileNotFoundAPIError, CleanupAPIError
+)
 from web.utils.error_builder import APIErrorBuilder
+from web.utils.validators.file_size_validator import _file_too_large_message
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -24,24 +30,33 @@ def upload_file():
         return _create_success_response(file_info, saved_file_path)
     except ValidationError as e:
         logger.error(f"Validation error: {str(e)}")
-        return APIErrorBuilder.validation_error(str(e))
+        raise ValidationAPIError(str(e))
     except FileProcessingError as e:
         logger.error(f"File processing error: {str(e)}")
-        return APIErrorBuilder.processing_error(str(e))
+        raise ProcessingAPIError(str(e))
     except Exception as e:
         logger.error(f"Unexpected error during file upload: {str(e)}")
-        return APIErrorBuilder.internal_error("An internal error occurred during file upload")
+        raise InternalAPIError("An internal error occurred during file upload")
 
 def _extract_file_from_request():
     """Extract file from request with validation"""
-    if 'file' not in request.files:
+    try:
+        files = request.files
+    except RequestEntityTooLarge:
+        # Bodies over MAX_CONTENT_LENGTH are refused before validation sees them
+        raise ValidationError(_file_too_large_message(_max_upload_size()))
+    
+    if 'file' not in files:
         raise ValidationError('Please select a file to upload')
-    return request.files['file']
+    return files['file']
+
+def _max_upload_size():
+    """Configured upload size limit in bytes"""
+    return current_app.config.get('MAX_CONTENT_LENGTH', 50 * 1024 * 1024)
 
 def _validate_file(file):
     """Validate uploaded file and return file info"""
-    max_size = current_app.config.get('MAX_CONTENT_LENGTH', 50 * 1024 * 1024)
-    is_valid, error_message, file_info = validate_upload_file(file, max_size)
+    is_valid, error_message, file_info = validate_upload_file(file, _max_upload_size())
     
     if not is_valid:
         logger.warning(f"File validation failed: {error_message}")
@@ -61,8 +76,8 @@ def _save_file(file, file_info):
         logger.info(f"File saved successfully: {file_path}")
         return file_path
     except Exception as e:
-        if file_path.exists():
-            cleanup_file(str(file_path))
+        # cleanup_file tolerates a file that was never created
+        cleanup_file(str(file_path))
         logger.error(f"Error saving file: {str(e)}")
         raise FileProcessingError('Failed to save uploaded file')
 
@@ -100,22 +115,22 @@ def get_upload_info():
         
     except Exception as e:
         logger.error(f"Error getting upload info: {str(e)}")
-        return APIErrorBuilder.internal_error('Failed to retrieve upload configuration')
+        raise InternalAPIError('Failed to retrieve upload configuration')
 
 def cleanup_upload(file_id):
     """Clean up uploaded file by file ID"""
     try:
         file_path = _get_file_path(file_id)
-        
-        if cleanup_file(str(file_path)):
-            logger.info(f"File cleaned up successfully: {file_path}")
-            return APIErrorBuilder.success_response({'message': 'File cleaned up successfully'})
-        else:
-            return APIErrorBuilder.file_not_found()
-            
+        removed = cleanup_file(str(file_path))
     except Exception as e:
         logger.error(f"Error during cleanup: {str(e)}")
-        return APIErrorBuilder.cleanup_error()
+        raise CleanupAPIError()
+    
+    if not removed:
+        raise FileNotFoundAPIError()
+    
+    logger.info(f"File cleaned up successfully: {file_path}")
+    return APIErrorBuilder.success_response({'message': 'File cleaned up successfully'})
 
 def _get_file_path(file_id):
     """Reconstruct file path from file ID"""
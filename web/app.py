@@ -10,7 +10,6 @@ from pathlib import Path
 from flask import Flask, jsonify
 from flask_cors import CORS
 from dotenv import load_dotenv
-import logging
 
 # Add project root to path for imports (only when running directly)
 if __name__ == '__main__':
@@ -24,18 +23,13 @@ from web.main.routes import main_bp
 from web.api.routes import api_bp
 from web.utils.errors import create_error_response
 from web.utils.directories import DirectoryManager
+from web.utils.logging_setup import configure_logging
 from web.websocket import init_websocket
 from web.api.processor import init_processor
 
 # Load environment variables
 load_dotenv()
 
-def configure_logging():
-    """Configure application logging"""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
 
 
 def register_error_handlers(app):
@@ -57,6 +51,10 @@ def create_app(config_class=WebConfig):
     app = Flask(__name__)
     app.config.from_object(config_class)
     
+    # Emit compact, unsorted JSON from jsonify regardless of debug mode
+    app.json.sort_keys = False
+    app.json.compact = True
+    
     # Create necessary directories
     DirectoryManager.ensure_directories_exist(
         config_class.get_required_directories()
@@ -40,6 +40,11 @@ class Config:
     WEBSOCKET_PING_TIMEOUT = int(os.environ.get('WEBSOCKET_PING_TIMEOUT', 60))
     WEBSOCKET_PING_INTERVAL = int(os.environ.get('WEBSOCKET_PING_INTERVAL', 25))
     WEBSOCKET_MAX_CONNECTIONS = int(os.environ.get('WEBSOCKET_MAX_CONNECTIONS', 100))
+    # Message queue URL (e.g. redis://localhost:6379/0) so emits reach clients on
+    # every worker process; redis:// needs the redis package installed
+    WEBSOCKET_MESSAGE_QUEUE = os.environ.get('WEBSOCKET_MESSAGE_QUEUE')
+    # Server async mode ('eventlet', 'gevent', 'threading'); unset auto-detects
+    SOCKETIO_ASYNC_MODE = os.environ.get('SOCKETIO_ASYNC_MODE')
     
     # Progress tracking configuration
     PROGRESS_UPDATE_INTERVAL = float(os.environ.get('PROGRESS_UPDATE_INTERVAL', 1.0))
@@ -4,6 +4,8 @@ Handles ONLY job state tracking and metadata management
 """
 
 import logging
+import threading
+import time
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 from typing_extensions import TypedDict
@@ -15,19 +17,33 @@ class JobInfo(TypedDict):
     """Type-safe job information structure"""
     job_id: str
     stages: List[str]
+    stage_index: Dict[str, int]
     current_stage_index: int
     current_stage: str
     overall_progress: int
     stage_progress: int
     status: str
     start_time: datetime
+    start_ts: float
     estimated_duration: Optional[int]
     estimated_completion: Optional[datetime]
     last_update: datetime
+    last_update_ts: float
     messages: List[Dict[str, Any]]
     end_time: Optional[datetime]
     duration: Optional[float]
     error: Optional[str]
+    room: str
+    started_payload: Dict[str, Any]
+
+
+# Public projection of JobInfo returned by status queries; internal caches
+# (stage index, monotonic timestamps, room, prebuilt payloads) are left out
+_STATUS_FIELDS = (
+    'job_id', 'stages', 'current_stage_index', 'current_stage', 'overall_progress',
+    'stage_progress', 'status', 'estimated_duration', 'messages', 'duration', 'error'
+)
+_STATUS_DATETIME_FIELDS = ('start_time', 'last_update', 'end_time', 'estimated_completion')
 
 
 class JobStateManager:
@@ -39,53 +55,75 @@ class JobStateManager:
     - Updating job progress and status
     - Retrieving job information
     - Managing job lifecycle states
+    
+    The job map is copy-on-write: writers build a new dict under a lock and
+    swap the reference, so readers (status polls, progress lookups) never
+    lock and always see a consistent snapshot.
     """
     
     def __init__(self):
         self.active_jobs: Dict[str, JobInfo] = {}
+        self._write_lock = threading.Lock()
         logger.info("JobStateManager initialized")
     
     def create_job(self, job_id: str, stages: List[str], 
                    estimated_duration: Optional[int] = None) -> JobInfo:
         """Create new job with initial state"""
+        start_time = datetime.utcnow()
+        start_ts = time.monotonic()
         job_info: JobInfo = {
             'job_id': job_id,
             'stages': stages,
+            'stage_index': {name: i for i, name in enumerate(stages)},
             'current_stage_index': 0,
             'current_stage': stages[0] if stages else 'unknown',
             'overall_progress': 0,
             'stage_progress': 0,
             'status': 'started',
-            'start_time': datetime.utcnow(),
+            'start_time': start_time,
+            'start_ts': start_ts,
             'estimated_duration': estimated_duration,
             'estimated_completion': self._calculate_completion_time(estimated_duration),
-            'last_update': datetime.utcnow(),
+            'last_update': start_time,
+            'last_update_ts': start_ts,
             'messages': [],
             'end_time': None,
             'duration': None,
-            'error': None
+            'error': None,
+            'room': f"job_{job_id}",
+            # job_started payload is fixed for the job's lifetime, build it once
+            'started_payload': {
+                'job_id': job_id,
+                'stages': stages,
+                'estimated_duration': estimated_duration,
+                'status': 'started',
+                'timestamp': start_time.isoformat()
+            }
         }
         
-        self.active_jobs[job_id] = job_info
+        with self._write_lock:
+            jobs = dict(self.active_jobs)
+            jobs[job_id] = job_info
+            self.active_jobs = jobs
         logger.info(f"Job {job_id} created with stages: {stages}")
         return job_info
     
     def update_job_progress(self, job_id: str, stage: str, progress: int, 
                            message: str, stage_progress: Optional[int] = None) -> Optional[JobInfo]:
         """Update job progress and add message"""
-        if job_id not in self.active_jobs:
+        job_info = self.active_jobs.get(job_id)
+        if job_info is None:
             return None
-        
-        job_info = self.active_jobs[job_id]
         job_info['current_stage'] = stage
         job_info['overall_progress'] = max(0, min(100, progress))
         job_info['last_update'] = datetime.utcnow()
+        job_info['last_update_ts'] = time.monotonic()
         
         if stage_progress is not None:
             job_info['stage_progress'] = max(0, min(100, stage_progress))
         
         job_info['messages'].append({
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': job_info['last_update'].isoformat(),
             'stage': stage,
             'message': message,
             'progress': progress
@@ -95,13 +133,12 @@ class JobStateManager:
     
     def advance_stage(self, job_id: str, completed_stage: str) -> Optional[str]:
         """Advance job to next stage, return next stage name or None"""
-        if job_id not in self.active_jobs:
+        job_info = self.active_jobs.get(job_id)
+        if job_info is None:
             return None
         
-        job_info = self.active_jobs[job_id]
-        
-        if completed_stage in job_info['stages']:
-            current_index = job_info['stages'].index(completed_stage)
+        current_index = job_info['stage_index'].get(completed_stage)
+        if current_index is not None:
             job_info['current_stage_index'] = current_index + 1
             
             if current_index + 1 < len(job_info['stages']):
@@ -116,13 +153,12 @@ class JobStateManager:
     
     def complete_job(self, job_id: str, success: bool) -> bool:
         """Mark job as completed or failed"""
-        if job_id not in self.active_jobs:
+        job_info = self.active_jobs.get(job_id)
+        if job_info is None:
             return False
-        
-        job_info = self.active_jobs[job_id]
         job_info['status'] = 'completed' if success else 'failed'
         job_info['end_time'] = datetime.utcnow()
-        job_info['duration'] = (job_info['end_time'] - job_info['start_time']).total_seconds()
+        job_info['duration'] = time.monotonic() - job_info['start_ts']
         
         if success:
             job_info['overall_progress'] = 100
@@ -131,14 +167,13 @@ class JobStateManager:
     
     def fail_job(self, job_id: str, error: str, stage: Optional[str] = None) -> bool:
         """Mark job as failed with error message"""
-        if job_id not in self.active_jobs:
+        job_info = self.active_jobs.get(job_id)
+        if job_info is None:
             return False
-        
-        job_info = self.active_jobs[job_id]
         job_info['status'] = 'failed'
         job_info['error'] = error
         job_info['end_time'] = datetime.utcnow()
-        job_info['duration'] = (job_info['end_time'] - job_info['start_time']).total_seconds()
+        job_info['duration'] = time.monotonic() - job_info['start_ts']
         
         return True
     
@@ -152,24 +187,24 @@ class JobStateManager:
         if not job_info:
             return None
         
-        serializable = job_info.copy()
-        serializable['start_time'] = job_info['start_time'].isoformat()
-        serializable['last_update'] = job_info['last_update'].isoformat()
-        
-        if job_info['end_time']:
-            serializable['end_time'] = job_info['end_time'].isoformat()
-        if job_info['estimated_completion']:
-            serializable['estimated_completion'] = job_info['estimated_completion'].isoformat()
+        serializable = {key: job_info[key] for key in _STATUS_FIELDS}
+        for key in _STATUS_DATETIME_FIELDS:
+            value = job_info[key]
+            serializable[key] = value.isoformat() if value is not None else None
         
         return serializable
     
     def remove_job(self, job_id: str) -> bool:
         """Remove job from tracking"""
-        if job_id in self.active_jobs:
-            del self.active_jobs[job_id]
-            logger.info(f"Job {job_id} removed from tracking")
-            return True
-        return False
+        with self._write_lock:
+            if job_id not in self.active_jobs:
+                return False
+            jobs = dict(self.active_jobs)
+            del jobs[job_id]
+            self.active_jobs = jobs
+        
+        logger.info(f"Job {job_id} removed from tracking")
+        return True
     
     def get_active_job_ids(self) -> List[str]:
         """Get list of active job IDs"""
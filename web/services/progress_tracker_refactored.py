@@ -4,6 +4,7 @@ Coordinates between single-purpose components using dependency injection
 """
 
 import logging
+import threading
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
@@ -44,8 +45,7 @@ class ProgressTracker:
             
             if self.broadcaster:
                 self.broadcaster.broadcast_job_started(
-                    job_id, stages, estimated_duration, 
-                    job_info['start_time'].isoformat()
+                    job_id, job_info['started_payload'], job_info['room']
                 )
             
             logger.info(f"Job {job_id} started with stages: {stages}")
@@ -67,14 +67,15 @@ class ProgressTracker:
                 return
             
             if self.broadcaster:
-                estimated_remaining = self.calculator.calculate_estimated_remaining(job_info)
+                elapsed_s = self.calculator.calculate_elapsed_seconds(job_info)
                 
                 self.broadcaster.broadcast_progress_update(
                     job_id, stage, progress, job_info['stage_progress'],
-                    message, estimated_remaining, job_info['last_update'].isoformat()
+                    message, elapsed_s, job_info['last_update'].isoformat(),
+                    job_info['room']
                 )
             
-            logger.debug(f"Job {job_id} progress: {progress}% - {stage}: {message}")
+            logger.debug("Job %s progress: %d%% - %s: %s", job_id, progress, stage, message)
             
         except Exception as e:
             logger.error(f"Error updating progress for job {job_id}: {str(e)}")
@@ -86,8 +87,10 @@ class ProgressTracker:
             next_stage = self.state_manager.advance_stage(job_id, stage)
             
             if self.broadcaster:
+                job_info = self.state_manager.get_job(job_id)
                 self.broadcaster.broadcast_stage_completed(
-                    job_id, stage, next_stage, datetime.utcnow().isoformat()
+                    job_id, stage, next_stage, datetime.utcnow().isoformat(),
+                    job_info['room'] if job_info else None
                 )
             
             logger.info(f"Job {job_id} completed stage: {stage}, next: {next_stage}")
@@ -113,7 +116,7 @@ class ProgressTracker:
                 
                 self.broadcaster.broadcast_job_completed(
                     job_id, success, processing_time, job_info['duration'],
-                    job_info['end_time'].isoformat(), result_data
+                    job_info['end_time'].isoformat(), result_data, job_info['room']
                 )
             
             logger.info(f"Job {job_id} {'completed' if success else 'failed'} in {job_info['duration']:.1f}s")
@@ -144,7 +147,7 @@ class ProgressTracker:
                 
                 self.broadcaster.broadcast_job_failed(
                     job_id, error, stage or job_info['current_stage'],
-                    processing_time, job_info['end_time'].isoformat()
+                    processing_time, job_info['end_time'].isoformat(), job_info['room']
                 )
             
             logger.error(f"Job {job_id} failed in stage '{stage}': {error}")
@@ -177,19 +180,27 @@ class ProgressTracker:
         logger.info(f"Job {job_id} scheduled for cleanup in {delay_minutes} minutes")
 
 
-# Singleton pattern for backward compatibility
-_progress_tracker_instance = None
+def _create_progress_tracker() -> ProgressTracker:
+    """Create the progress tracker with the shared SocketIO instance if available"""
+    try:
+        from web.websocket import get_socketio
+        return ProgressTracker(get_socketio())
+    except ImportError:
+        logger.warning("WebSocket unavailable - creating progress tracker without broadcasting")
+        return ProgressTracker(None)
+
+
+# Singleton pattern for backward compatibility; created on first use so that
+# importing this module does not pull in Flask-SocketIO
+_progress_tracker_instance: Optional[ProgressTracker] = None
+_progress_tracker_lock = threading.Lock()
 
 def get_progress_tracker() -> ProgressTracker:
     """Get the global progress tracker instance with dependency injection"""
     global _progress_tracker_instance
     if _progress_tracker_instance is None:
-        try:
-            from web.websocket import get_socketio
-            socketio = get_socketio()
-            _progress_tracker_instance = ProgressTracker(socketio)
-        except ImportError:
-            logger.warning("WebSocket unavailable - creating progress tracker without broadcasting")
-            _progress_tracker_instance = ProgressTracker(None)
-    
+        # Concurrent first callers must share one tracker and its job state
+        with _progress_tracker_lock:
+            if _progress_tracker_instance is None:
+                _progress_tracker_instance = _create_progress_tracker()
     return _progress_tracker_instance
\ No newline at end of file
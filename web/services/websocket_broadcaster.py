@@ -4,14 +4,18 @@ Handles ONLY WebSocket message broadcasting and room management
 """
 
 import logging
-from typing import Dict, Any, Optional, Protocol
+from typing import Dict, Any, List, Optional, Protocol
 
 logger = logging.getLogger(__name__)
 
+# Rooms larger than this are emitted to in slices, yielding between slices
+EMIT_BATCH_SIZE = 50
+
 
 class WebSocketEmitter(Protocol):
     """Protocol for WebSocket emitter interface"""
     def emit(self, event: str, data: Dict[str, Any], room: Optional[str] = None) -> None: ...
+    def sleep(self, seconds: float = 0) -> None: ...
 
 
 class WebSocketBroadcaster:
@@ -28,21 +32,15 @@ class WebSocketBroadcaster:
         self.socketio = socketio
         logger.info("WebSocketBroadcaster initialized")
     
-    def broadcast_job_started(self, job_id: str, stages: list, 
-                            estimated_duration: Optional[int], timestamp: str) -> None:
-        """Broadcast job started event"""
-        data = {
-            'job_id': job_id,
-            'stages': stages,
-            'estimated_duration': estimated_duration,
-            'status': 'started',
-            'timestamp': timestamp
-        }
-        self._broadcast_to_job_room(job_id, 'job_started', data)
+    def broadcast_job_started(self, job_id: str, payload: Dict[str, Any],
+                            room: Optional[str] = None) -> None:
+        """Broadcast job started event using the payload prebuilt at job creation"""
+        self._broadcast_to_job_room(job_id, 'job_started', payload, room)
     
     def broadcast_progress_update(self, job_id: str, stage: str, progress: int,
                                 stage_progress: int, message: str, 
-                                estimated_remaining: Optional[str], timestamp: str) -> None:
+                                elapsed_s: float, timestamp: str,
+                                room: Optional[str] = None) -> None:
         """Broadcast progress update event"""
         data = {
             'job_id': job_id,
@@ -50,13 +48,14 @@ class WebSocketBroadcaster:
             'progress': progress,
             'stage_progress': stage_progress,
             'message': message,
-            'estimated_remaining': estimated_remaining,
+            'elapsed_s': elapsed_s,
             'timestamp': timestamp
         }
-        self._broadcast_to_job_room(job_id, 'progress_update', data)
+        self._broadcast_to_job_room(job_id, 'progress_update', data, room)
     
     def broadcast_stage_completed(self, job_id: str, completed_stage: str,
-                                next_stage: Optional[str], timestamp: str) -> None:
+                                next_stage: Optional[str], timestamp: str,
+                                room: Optional[str] = None) -> None:
         """Broadcast stage completion event"""
         data = {
             'job_id': job_id,
@@ -64,11 +63,12 @@ class WebSocketBroadcaster:
             'next_stage': next_stage,
             'timestamp': timestamp
         }
-        self._broadcast_to_job_room(job_id, 'stage_completed', data)
+        self._broadcast_to_job_room(job_id, 'stage_completed', data, room)
     
     def broadcast_job_completed(self, job_id: str, success: bool, processing_time: str,
                               duration_seconds: float, timestamp: str,
-                              result_data: Optional[Dict[str, Any]] = None) -> None:
+                              result_data: Optional[Dict[str, Any]] = None,
+                              room: Optional[str] = None) -> None:
         """Broadcast job completion event"""
         data = {
             'job_id': job_id,
@@ -83,10 +83,11 @@ class WebSocketBroadcaster:
             data.update(result_data)
         
         event_name = 'job_completed' if success else 'job_failed'
-        self._broadcast_to_job_room(job_id, event_name, data)
+        self._broadcast_to_job_room(job_id, event_name, data, room)
     
     def broadcast_job_failed(self, job_id: str, error: str, stage: str,
-                           processing_time: str, timestamp: str) -> None:
+                           processing_time: str, timestamp: str,
+                           room: Optional[str] = None) -> None:
         """Broadcast job failure event"""
         data = {
             'job_id': job_id,
@@ -96,13 +97,45 @@ class WebSocketBroadcaster:
             'processing_time': processing_time,
             'timestamp': timestamp
         }
-        self._broadcast_to_job_room(job_id, 'job_failed', data)
+        self._broadcast_to_job_room(job_id, 'job_failed', data, room)
     
-    def _broadcast_to_job_room(self, job_id: str, event: str, data: Dict[str, Any]) -> None:
-        """Broadcast message to job-specific room"""
+    def _broadcast_to_job_room(self, job_id: str, event: str, data: Dict[str, Any],
+                               room: Optional[str] = None) -> None:
+        """Broadcast message to job-specific room (room name cached per job when known)"""
         try:
-            room = f"job_{job_id}"
-            self.socketio.emit(event, data, room=room)
-            logger.debug(f"Broadcasted {event} to room {room}")
+            if room is None:
+                room = f"job_{job_id}"
+            
+            participants = self._get_room_participants(room)
+            if participants is not None and not participants:
+                logger.debug("Skipped %s: no subscribers in room %s", event, room)
+                return
+            
+            if participants is None or len(participants) <= EMIT_BATCH_SIZE:
+                self.socketio.emit(event, data, room=room)
+            else:
+                self._emit_in_batches(event, data, participants)
+            logger.debug("Broadcasted %s to room %s", event, room)
         except Exception as e:
-            logger.error(f"Error broadcasting {event} to job {job_id}: {str(e)}")
\ No newline at end of file
+            logger.error(f"Error broadcasting {event} to job {job_id}: {str(e)}")
+    
+    def _emit_in_batches(self, event: str, data: Dict[str, Any], participants: List[str]) -> None:
+        """Emit to a large room slice by slice, yielding to other greenlets in between"""
+        for start in range(0, len(participants), EMIT_BATCH_SIZE):
+            if start:
+                self.socketio.sleep(0)
+            self.socketio.emit(event, data, to=participants[start:start + EMIT_BATCH_SIZE])
+    
+    def _get_room_participants(self, room: str) -> Optional[List[str]]:
+        """Get session ids joined to the room, or None when they cannot be determined"""
+        server = getattr(self.socketio, 'server', None)
+        manager = getattr(server, 'manager', None)
+        
+        # Message-queue managers only see local participants, so always emit
+        if manager is None or hasattr(manager, 'channel'):
+            return None
+        
+        try:
+            return [sid for sid, _ in manager.get_participants('/', room)]
+        except Exception:
+            return None
@@ -11,25 +11,31 @@ from datetime import datetime
 class WebSocketEmitter(Protocol):
     """Protocol for WebSocket emitter interface"""
     def emit(self, event: str, data: Dict[str, Any], room: Optional[str] = None) -> None: ...
+    def sleep(self, seconds: float = 0) -> None: ...
 
 
 class JobInfo(TypedDict, total=False):
     """Type-safe job information structure"""
     job_id: str
     stages: List[str]
+    stage_index: Dict[str, int]
     current_stage_index: int
     current_stage: str
     overall_progress: int  
     stage_progress: int
     status: str
     start_time: datetime
+    start_ts: float
     estimated_duration: Optional[int]
     estimated_completion: Optional[datetime]
     last_update: datetime
+    last_update_ts: float
     messages: List[Dict[str, Any]]
     end_time: Optional[datetime]
     duration: Optional[float]
     error: Optional[str]
+    room: str
+    started_payload: 'JobStartedData'
 
 
 class ProgressUpdateData(TypedDict):
@@ -39,7 +45,7 @@ class ProgressUpdateData(TypedDict):
     progress: int
     stage_progress: int
     message: str
-    estimated_remaining: Optional[str]
+    elapsed_s: float
     timestamp: str
 
 
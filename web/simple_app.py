@@ -54,6 +54,10 @@ def create_app(config_class=WebConfig):
     app = Flask(__name__)
     app.config.from_object(config_class)
     
+    # Emit compact, unsorted JSON from jsonify regardless of debug mode
+    app.json.sort_keys = False
+    app.json.compact = True
+    
     # Create necessary directories
     DirectoryManager.ensure_directories_exist(
         config_class.get_required_directories()
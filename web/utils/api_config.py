@@ -2,6 +2,8 @@
 API configuration constants
 """
 
+from types import MappingProxyType
+
 
 class APIConfig:
     """Configuration constants for API responses"""
@@ -10,7 +12,8 @@ class APIConfig:
     API_VERSION = '1.0.0'
     API_DESCRIPTION = 'Web API for automated German thesis correction with AI analysis'
     
-    ENDPOINTS = {
+    # Read-only view so the shared constant cannot be mutated at runtime
+    ENDPOINTS = MappingProxyType({
         'health': '/health',
         'info': '/api/v1/info',
         'upload': '/api/v1/upload',
@@ -19,4 +22,4 @@ class APIConfig:
         'process': '/api/v1/process',
         'status': '/api/v1/status/{job_id}',
         'download': '/api/v1/download/{file_id}'
-    }
\ No newline at end of file
+    })
\ No newline at end of file
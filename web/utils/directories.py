@@ -2,7 +2,7 @@
 Directory management utilities
 """
 
-from pathlib import Path
+import os
 from typing import List
 
 
@@ -17,5 +17,13 @@ class DirectoryManager:
         Args:
             folders: List of folder paths to create
         """
-        for folder in folders:
-            Path(folder).mkdir(parents=True, exist_ok=True)
\ No newline at end of file
+        # Deduplicate and create parents before children, so each unique
+        # directory costs a single mkdir in the common case
+        unique_folders = {os.path.normpath(os.fspath(folder)) for folder in folders}
+        for folder in sorted(unique_folders, key=len):
+            try:
+                os.mkdir(folder)
+            except FileExistsError:
+                continue
+            except FileNotFoundError:
+                os.makedirs(folder, exist_ok=True)
\ No newline at end of file
@@ -3,97 +3,132 @@ Standardized API error response builder
 Reduces duplication and ensures consistent error responses
 """
 
-from flask import jsonify
-from typing import Tuple
+from flask import Response
+
+from .errors import _error_body, _json_response
+
+
+# Default messages and their pre-serialized bodies, built once at import
+_SAVE_FAILED_MESSAGE = "Failed to save uploaded file"
+_INTERNAL_ERROR_MESSAGE = "An internal error occurred"
+_FILE_NOT_FOUND_MESSAGE = "File not found or already cleaned up"
+_CLEANUP_ERROR_MESSAGE = "Failed to clean up file"
+_NO_FILE_PROVIDED_MESSAGE = "No file provided"
+_NOT_FOUND_MESSAGE = "Resource not found"
+
+
+_CACHED_SAVE_FAILED = _error_body('save_failed', _SAVE_FAILED_MESSAGE)
+_CACHED_INTERNAL_ERROR = _error_body('internal_error', _INTERNAL_ERROR_MESSAGE)
+_CACHED_FILE_NOT_FOUND = _error_body('file_not_found', _FILE_NOT_FOUND_MESSAGE)
+_CACHED_CLEANUP_ERROR = _error_body('cleanup_error', _CLEANUP_ERROR_MESSAGE)
+_CACHED_NO_FILE_PROVIDED = _error_body('no_file_provided', _NO_FILE_PROVIDED_MESSAGE)
+_CACHED_NOT_FOUND = _error_body('not_found', _NOT_FOUND_MESSAGE)
+
+
+def _cached_response(body: bytes, status: int) -> Response:
+    """Wrap a pre-serialized body in a fresh response"""
+    return Response(body, status=status, mimetype='application/json')
 
 
 class APIErrorBuilder:
     """Standardized error response builder following DRY principle"""
     
     @staticmethod
-    def validation_error(message: str) -> Tuple:
+    def validation_error(message: str) -> Response:
         """Create validation error response"""
-        return jsonify({
+        return _json_response({
             'success': False,
             'error': 'validation_error',
             'message': message
-        }), 400
+        }, 400)
     
     @staticmethod
-    def validation_failed(message: str) -> Tuple:
+    def validation_failed(message: str) -> Response:
         """Create validation failed response"""
-        return jsonify({
+        return _json_response({
             'success': False,
             'error': 'validation_failed',
             'message': message
-        }), 400
+        }, 400)
     
     @staticmethod
-    def processing_error(message: str) -> Tuple:
+    def processing_error(message: str) -> Response:
         """Create processing error response"""
-        return jsonify({
+        return _json_response({
             'success': False,
             'error': 'processing_error',
             'message': message
-        }), 500
+        }, 500)
     
     @staticmethod
-    def save_failed(message: str = "Failed to save uploaded file") -> Tuple:
+    def save_failed(message: str = _SAVE_FAILED_MESSAGE) -> Response:
         """Create save failed error response"""
-        return jsonify({
+        if message == _SAVE_FAILED_MESSAGE:
+            return _cached_response(_CACHED_SAVE_FAILED, 500)
+        return _json_response({
             'success': False,
             'error': 'save_failed',
             'message': message
-        }), 500
+        }, 500)
     
     @staticmethod
-    def internal_error(message: str = "An internal error occurred") -> Tuple:
+    def internal_error(message: str = _INTERNAL_ERROR_MESSAGE) -> Response:
         """Create internal error response"""
-        return jsonify({
+        if message == _INTERNAL_ERROR_MESSAGE:
+            return _cached_response(_CACHED_INTERNAL_ERROR, 500)
+        return _json_response({
             'success': False,
             'error': 'internal_error',
             'message': message
-        }), 500
+        }, 500)
     
     @staticmethod
-    def file_not_found(message: str = "File not found or already cleaned up") -> Tuple:
+    def file_not_found(message: str = _FILE_NOT_FOUND_MESSAGE) -> Response:
         """Create file not found error response"""
-        return jsonify({
+        if message == _FILE_NOT_FOUND_MESSAGE:
+            return _cached_response(_CACHED_FILE_NOT_FOUND, 404)
+        return _json_response({
             'success': False,
             'error': 'file_not_found',
             'message': message
-        }), 404
+        }, 404)
     
     @staticmethod
-    def cleanup_error(message: str = "Failed to clean up file") -> Tuple:
+    def cleanup_error(message: str = _CLEANUP_ERROR_MESSAGE) -> Response:
         """Create cleanup error response"""
-        return jsonify({
+        if message == _CLEANUP_ERROR_MESSAGE:
+            return _cached_response(_CACHED_CLEANUP_ERROR, 500)
+        return _json_response({
             'success': False,
             'error': 'cleanup_error',
             'message': message
-        }), 500
+        }, 500)
     
     @staticmethod
-    def no_file_provided(message: str = "No file provided") -> Tuple:
+    def no_file_provided(message: str = _NO_FILE_PROVIDED_MESSAGE) -> Response:
         """Create no file provided error response"""
-        return jsonify({
+        if message == _NO_FILE_PROVIDED_MESSAGE:
+            return _cached_response(_CACHED_NO_FILE_PROVIDED, 400)
+        return _json_response({
             'success': False,
             'error': 'no_file_provided',
             'message': message
-        }), 400
+        }, 400)
     
     @staticmethod
-    def success_response(data: dict) -> Tuple:
+    def success_response(data: dict) -> Response:
         """Create standardized success response"""
         response_data = {'success': True}
         response_data.update(data)
-        return jsonify(response_data), 200
+        return _json_response(response_data, 200)
     
     @staticmethod
-    def not_found_error(message: str = "Resource not found") -> Tuple:
+    def not_found_error(message: str = _NOT_FOUND_MESSAGE) -> Response:
         """Create not found error response"""
-        return jsonify({
+        if message == _NOT_FOUND_MESSAGE:
+            return _cached_response(_CACHED_NOT_FOUND, 404)
+        return _json_response({
             'success': False,
             'error': 'not_found',
             'message': message
-        }), 404
\ No newline at end of file
+        }, 404)
\ No newline at end of file
@@ -2,7 +2,22 @@
 Error handling utilities
 """
 
-from flask import jsonify
+from typing import Optional
+
+from flask import Response
+from werkzeug.exceptions import HTTPException
+
+# Use orjson for response bodies when available, fallback to stdlib json
+try:
+    import orjson
+
+    def _dumps(payload: dict) -> bytes:
+        return orjson.dumps(payload)
+except ImportError:
+    import json
+
+    def _dumps(payload: dict) -> bytes:
+        return json.dumps(payload, separators=(',', ':')).encode('utf-8')
 
 
 class ValidationError(Exception):
@@ -20,7 +35,96 @@ class ProcessingError(Exception):
     pass
 
 
-def create_error_response(error_type: str, message: str, status_code: int):
+def _error_body(error: str, message: str) -> bytes:
+    """Serialize a standard API error payload"""
+    return _dumps({'success': False, 'error': error, 'message': message})
+
+
+class APIError(HTTPException):
+    """
+    Base class for API errors rendered as the standard JSON error body
+    
+    Subclasses set code, error and default_message; the body for the
+    default message is serialized once when the class is defined.
+    Raising one from a view needs no registered handler since Flask
+    renders unhandled HTTPExceptions through get_response.
+    """
+    code = 500
+    error = 'internal_error'
+    default_message = 'An internal error occurred'
+    _cached_body: bytes
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._cached_body = _error_body(cls.error, cls.default_message)
+    
+    def __init__(self, message: Optional[str] = None):
+        super().__init__(message or self.default_message)
+    
+    @property
+    def body(self) -> bytes:
+        """Serialized JSON body, reusing the cached default when possible"""
+        if self.description == self.default_message:
+            return self._cached_body
+        return _error_body(self.error, self.description)
+    
+    def get_response(self, environ=None, scope=None) -> Response:
+        """Render as JSON wherever Flask falls back to the exception itself"""
+        return Response(self.body, status=self.code, mimetype='application/json')
+
+
+# __init_subclass__ only covers subclasses; a bare APIError needs its own body
+APIError._cached_body = _error_body(APIError.error, APIError.default_message)
+
+
+class ValidationAPIError(APIError):
+    """Request failed input validation"""
+    code = 400
+    error = 'validation_error'
+    default_message = 'Invalid request'
+
+
+class ProcessingAPIError(APIError):
+    """Server-side processing of a valid request failed"""
+    code = 500
+    error = 'processing_error'
+    default_message = 'Processing failed'
+
+
+class InternalAPIError(APIError):
+    """Unexpected server error"""
+    code = 500
+    error = 'internal_error'
+    default_message = 'An internal error occurred'
+
+
+class NotFoundAPIError(APIError):
+    """Requested resource does not exist"""
+    code = 404
+    error = 'not_found'
+    default_message = 'Resource not found'
+
+
+class FileNotFoundAPIError(APIError):
+    """Uploaded file does not exist or was already removed"""
+    code = 404
+    error = 'file_not_found'
+    default_message = 'File not found or already cleaned up'
+
+
+class CleanupAPIError(APIError):
+    """Uploaded file could not be removed"""
+    code = 500
+    error = 'cleanup_error'
+    default_message = 'Failed to clean up file'
+
+
+def _json_response(payload: dict, status: int) -> Response:
+    """Serialize payload into a JSON response without going through jsonify"""
+    return Response(_dumps(payload), status=status, mimetype='application/json')
+
+
+def create_error_response(error_type: str, message: str, status_code: int) -> Response:
     """
     Create standardized error response
     
@@ -30,9 +134,9 @@ def create_error_response(error_type: str, message: str, status_code: int):
         status_code: HTTP status code
         
     Returns:
-        Tuple of (JSON response, status code)
+        JSON response carrying the status code
     """
-    return jsonify({
+    return _json_response({
         'error': error_type,
         'message': message
-    }), status_code
\ No newline at end of file
+    }, status_code)
@@ -5,30 +5,26 @@ Provides comprehensive validation for DOCX files with security considerations
 
 import os
 import uuid
-import tempfile
 import logging
-from pathlib import Path
-from typing import Tuple, Optional
+from io import BytesIO
+from typing import BinaryIO, Optional, Tuple, Union
 from zipfile import ZipFile, BadZipFile
 from werkzeug.datastructures import FileStorage
 
-# Try to import magic, fallback if not available
-try:
-    import magic
-    MAGIC_AVAILABLE = True
-except ImportError:
-    MAGIC_AVAILABLE = False
-    logging.warning("python-magic not available, file type validation will use basic checks only")
+from .validators.file_size_validator import _file_too_large_message
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 # Security constants
 MAX_FILENAME_LENGTH = 255
+DOCX_SCAN_SIZE = 8192
+ZIP_SIGNATURE = b'PK\x03\x04'
 ALLOWED_EXTENSIONS = {'docx'}
-ALLOWED_MIME_TYPES = {
-    'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-}
+
+# Local file header names that mark a ZIP archive as an OOXML document;
+# [Content_Types].xml is conventionally the first entry
+DOCX_HEADER_MARKERS = (b'[Content_Types].xml', b'word/document.xml')
 
 # DOCX file structure requirements
 REQUIRED_DOCX_FILES = {
@@ -37,6 +33,10 @@ REQUIRED_DOCX_FILES = {
     'word/document.xml'
 }
 
+# Validation messages shared by the individual and one-pass checks
+INVALID_FORMAT_MESSAGE = "Invalid file format. File does not appear to be a valid DOCX document"
+INVALID_STRUCTURE_MESSAGE = "Invalid DOCX file structure"
+
 class FileValidationError(Exception):
     """Custom exception for file validation errors"""
     pass
@@ -54,13 +54,22 @@ def validate_file_extension(filename: str) -> bool:
     if not filename:
         return False
     
-    # Get file extension (case insensitive)
-    extension = Path(filename).suffix.lower().lstrip('.')
-    return extension in ALLOWED_EXTENSIONS
+    # Get file extension (case insensitive) without building a Path
+    dot = filename.rfind('.')
+    return dot > 0 and filename[dot + 1:].lower() in ALLOWED_EXTENSIONS
+
+def _is_docx_header(file_header: bytes) -> bool:
+    """Check the ZIP signature and an OOXML part name in the leading bytes"""
+    # DOCX files are ZIP archives; reject anything else outright
+    if not file_header.startswith(ZIP_SIGNATURE):
+        return False
+    
+    # An OOXML part name in the leading local headers marks a DOCX
+    return any(marker in file_header for marker in DOCX_HEADER_MARKERS)
 
 def validate_file_type_magic(file_stream) -> bool:
     """
-    Validate file type using magic numbers (not just extension)
+    Validate file type from the ZIP signature and OOXML part names (not just extension)
     
     Args:
         file_stream: File-like object to validate
@@ -69,76 +78,109 @@ def validate_file_type_magic(file_stream) -> bool:
         bool: True if file type is valid DOCX, False otherwise
     """
     try:
-        if not MAGIC_AVAILABLE:
-            # Fallback to basic ZIP signature check
-            current_pos = file_stream.tell()
-            file_stream.seek(0)
-            header = file_stream.read(4)
-            file_stream.seek(current_pos)
-            
-            # Check for ZIP signature (DOCX files are ZIP archives)
-            return header == b'PK\x03\x04'
-        
         # Save current position
         current_pos = file_stream.tell()
         
-        # Read first 2048 bytes for magic number detection
+        # Read enough of the header to cover the leading local file headers
         file_stream.seek(0)
-        file_header = file_stream.read(2048)
+        file_header = file_stream.read(DOCX_SCAN_SIZE)
         
         # Restore position
         file_stream.seek(current_pos)
         
-        # Use python-magic to detect MIME type
-        mime_type = magic.from_buffer(file_header, mime=True)
-        
-        logger.debug(f"Detected MIME type: {mime_type}")
-        return mime_type in ALLOWED_MIME_TYPES
+        return _is_docx_header(file_header)
         
     except Exception as e:
-        logger.error(f"Error detecting file type: {str(e)}")
+        logger.error("Error detecting file type: %s", e)
         return False
 
-def validate_docx_structure(file_path: str) -> bool:
+def _is_docx_archive(zip_file: ZipFile) -> bool:
+    """Check required DOCX parts exist and the main document is non-empty"""
+    # Check if required DOCX files are present (dict lookups, no namelist)
+    for required_file in REQUIRED_DOCX_FILES:
+        try:
+            zip_file.getinfo(required_file)
+        except KeyError:
+            logger.warning("Missing required DOCX file: %s", required_file)
+            return False
+    
+    # Check the main document XML is non-empty using the central
+    # directory's uncompressed size, without inflating it
+    if zip_file.getinfo('word/document.xml').file_size == 0:
+        logger.warning("Document XML is empty")
+        return False
+    
+    return True
+
+def validate_docx_structure(zip_source: Union[str, BinaryIO]) -> bool:
     """
     Validate DOCX file structure by checking internal ZIP structure
     
     Args:
-        file_path: Path to the file to validate
+        zip_source: Path to the file or seekable file-like object to validate
         
     Returns:
         bool: True if DOCX structure is valid, False otherwise
     """
     try:
-        with ZipFile(file_path, 'r') as zip_file:
-            # Get list of files in the ZIP
-            zip_contents = set(zip_file.namelist())
-            
-            # Check if required DOCX files are present
-            missing_files = REQUIRED_DOCX_FILES - zip_contents
-            if missing_files:
-                logger.warning(f"Missing required DOCX files: {missing_files}")
-                return False
-            
-            # Try to read the main document XML to ensure it's valid
-            try:
-                document_xml = zip_file.read('word/document.xml')
-                if len(document_xml) == 0:
-                    logger.warning("Document XML is empty")
-                    return False
-            except KeyError:
-                logger.warning("Cannot read document.xml from DOCX file")
-                return False
-            
-            return True
+        with ZipFile(zip_source, 'r') as zip_file:
+            return _is_docx_archive(zip_file)
             
     except BadZipFile:
         logger.warning("File is not a valid ZIP/DOCX file")
         return False
     except Exception as e:
-        logger.error(f"Error validating DOCX structure: {str(e)}")
+        logger.error("Error validating DOCX structure: %s", e)
         return False
 
+def _is_seekable(file_stream) -> bool:
+    """Check random access; SpooledTemporaryFile lacks seekable() before 3.11"""
+    seekable = getattr(file_stream, 'seekable', None)
+    if seekable is None:
+        return hasattr(file_stream, 'seek')
+    return seekable()
+
+def validate_docx_one_pass(file_stream: BinaryIO) -> Tuple[bool, str]:
+    """
+    Validate DOCX type and structure in a single pass over the upload stream
+    
+    The header read for type detection and the ZIP central directory
+    lookup share one stream; for seekable streams ZipFile reads only the
+    end-of-central-directory record and the directory itself. Streams
+    that cannot seek are buffered in memory first and are left consumed;
+    seekable streams are rewound to the start afterwards.
+    
+    Args:
+        file_stream: File-like object positioned anywhere
+        
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    seekable = _is_seekable(file_stream)
+    # ZipFile needs random access to reach the central directory
+    source = file_stream if seekable else BytesIO(file_stream.read())
+    
+    try:
+        source.seek(0)
+        if not _is_docx_header(source.read(DOCX_SCAN_SIZE)):
+            return False, INVALID_FORMAT_MESSAGE
+        
+        with ZipFile(source, 'r') as zip_file:
+            if not _is_docx_archive(zip_file):
+                return False, INVALID_STRUCTURE_MESSAGE
+        
+        return True, ""
+        
+    except BadZipFile:
+        logger.warning("File is not a valid ZIP/DOCX file")
+        return False, INVALID_STRUCTURE_MESSAGE
+    except Exception as e:
+        logger.error("Error validating DOCX file: %s", e)
+        return False, INVALID_STRUCTURE_MESSAGE
+    finally:
+        if seekable:
+            file_stream.seek(0)
+
 def generate_secure_filename() -> str:
     """
     Generate a secure UUID-based filename
@@ -146,8 +188,7 @@ def generate_secure_filename() -> str:
     Returns:
         str: Secure filename with .docx extension
     """
-    secure_name = str(uuid.uuid4())
-    return f"{secure_name}.docx"
+    return uuid.uuid4().hex + '.docx'
 
 def is_file_size_valid(file_size: int, max_size: int) -> bool:
     """
@@ -175,15 +216,17 @@ def sanitize_filename(filename: str) -> str:
     if not filename:
         return "unnamed_file.docx"
     
-    # Remove path components
-    filename = os.path.basename(filename)
+    # Remove path components (POSIX and Windows separators)
+    filename = filename[filename.rfind('/') + 1:]
+    filename = filename[filename.rfind('\\') + 1:]
     
-    # Limit length
-    if len(filename) > MAX_FILENAME_LENGTH:
-        name, ext = os.path.splitext(filename)
-        filename = name[:MAX_FILENAME_LENGTH-len(ext)] + ext
+    # Common case: already within the length limit
+    if len(filename) <= MAX_FILENAME_LENGTH:
+        return filename
     
-    return filename
+    # Limit length
+    name, ext = os.path.splitext(filename)
+    return name[:MAX_FILENAME_LENGTH-len(ext)] + ext
 
 def validate_upload_file(file: FileStorage, max_size: int) -> Tuple[bool, str, Optional[dict]]:
     """
@@ -217,28 +260,12 @@ def validate_upload_file(file: FileStorage, max_size: int) -> Tuple[bool, str, O
             if file_size == 0:
                 return False, "File is empty", None
             else:
-                return False, f"File too large. Maximum size: {max_size // (1024*1024)}MB", None
+                return False, _file_too_large_message(max_size), None
         
-        # Validate file type using magic numbers
-        if not validate_file_type_magic(file.stream):
-            return False, "Invalid file format. File does not appear to be a valid DOCX document", None
-        
-        # Create temporary file for structure validation
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as temp_file:
-            file.seek(0)
-            temp_file.write(file.read())
-            temp_file.flush()
-            
-            # Validate DOCX structure
-            if not validate_docx_structure(temp_file.name):
-                os.unlink(temp_file.name)
-                return False, "Invalid DOCX file structure", None
-            
-            # Clean up temp file
-            os.unlink(temp_file.name)
-        
-        # Reset file position for later use
-        file.seek(0)
+        # Validate file type and DOCX structure in one pass (rewinds the stream)
+        is_valid_docx, error_message = validate_docx_one_pass(file.stream)
+        if not is_valid_docx:
+            return False, error_message, None
         
         # Create file info
         file_info = {
@@ -247,11 +274,11 @@ def validate_upload_file(file: FileStorage, max_size: int) -> Tuple[bool, str, O
             'secure_filename': generate_secure_filename()
         }
         
-        logger.info(f"File validation successful: {original_filename} ({file_size} bytes)")
+        logger.info("File validation successful: %s (%d bytes)", original_filename, file_size)
         return True, "File validation successful", file_info
         
     except Exception as e:
-        logger.error(f"Unexpected error during file validation: {str(e)}")
+        logger.error("Unexpected error during file validation: %s", e)
         return False, "Internal error during file validation", None
 
 def cleanup_file(file_path: str) -> bool:
@@ -265,11 +292,11 @@ def cleanup_file(file_path: str) -> bool:
         bool: True if file was removed, False otherwise
     """
     try:
-        if os.path.exists(file_path):
-            os.unlink(file_path)
-            logger.info(f"File cleaned up: {file_path}")
-            return True
+        os.unlink(file_path)
+        logger.info("File cleaned up: %s", file_path)
+        return True
+    except FileNotFoundError:
         return False
     except Exception as e:
-        logger.error(f"Error cleaning up file {file_path}: {str(e)}")
+        logger.error("Error cleaning up file %s: %s", file_path, e)
         return False
\ No newline at end of file
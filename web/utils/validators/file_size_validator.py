@@ -2,10 +2,17 @@
 File size validation
 """
 
+from functools import lru_cache
 from typing import Tuple
 from .base_validator import BaseValidator
 
 
+@lru_cache(maxsize=8)
+def _file_too_large_message(max_size: int) -> str:
+    """Build the size limit error once per configured maximum"""
+    return f"File too large. Maximum size: {max_size // (1024 * 1024)}MB"
+
+
 class FileSizeValidator(BaseValidator):
     """Validates file size limits"""
     
@@ -15,7 +22,6 @@ class FileSizeValidator(BaseValidator):
             return False, "File is empty"
         
         if file_size > max_size:
-            max_size_mb = max_size // (1024 * 1024)
-            return False, f"File too large. Maximum size: {max_size_mb}MB"
+            return False, _file_too_large_message(max_size)
         
         return True, ""
\ No newline at end of file
@@ -3,27 +3,46 @@ MIME type validation with Strategy pattern implementation
 """
 
 import logging
+import threading
+from functools import cached_property
 from typing import Tuple
 from abc import ABC, abstractmethod
 from .base_validator import BaseValidator
-
-# Try to import magic, fallback if not available
-try:
-    import magic
-    MAGIC_AVAILABLE = True
-except ImportError:
-    MAGIC_AVAILABLE = False
-    logging.warning("python-magic not available, file type validation will use basic checks only")
+from .upload_inspection import UploadInspection
 
 logger = logging.getLogger(__name__)
 
+# python-magic loads libmagic, so it is imported on first use;
+# MAGIC_AVAILABLE stays None until then
+_magic_module = None
+MAGIC_AVAILABLE = None
+
+
+def _get_magic_module():
+    """Import python-magic on first call; returns None if it is not installed"""
+    global _magic_module, MAGIC_AVAILABLE
+    if MAGIC_AVAILABLE is None:
+        try:
+            import magic
+            _magic_module = magic
+            MAGIC_AVAILABLE = True
+        except ImportError:
+            MAGIC_AVAILABLE = False
+            logger.warning("python-magic not available, file type validation will use basic checks only")
+    return _magic_module
+
+# ZIP local file header signature; every DOCX starts with it
+ZIP_SIGNATURE = b'PK\x03\x04'
+
+INVALID_FORMAT_MESSAGE = "Invalid file format. File does not appear to be a valid DOCX document"
+
 
 class MimeDetectionStrategy(ABC):
     """Strategy interface for MIME type detection"""
     
     @abstractmethod
-    def detect(self, file_stream) -> str:
-        """Detect MIME type from file stream"""
+    def detect(self, header: bytes) -> str:
+        """Detect MIME type from the upload header"""
         pass
 
 
@@ -34,29 +53,23 @@ class MagicDetector(MimeDetectionStrategy):
         self.allowed_mime_types = {
             'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
         }
+        # Load the magic database once; libmagic cookies are not thread-safe
+        self._magic = _get_magic_module().Magic(mime=True)
+        self._lock = threading.Lock()
     
-    def detect(self, file_stream) -> str:
+    def detect(self, header: bytes) -> str:
         """Detect MIME type using magic library"""
-        current_pos = file_stream.tell()
-        file_stream.seek(0)
-        file_header = file_stream.read(2048)
-        file_stream.seek(current_pos)
-        
-        return magic.from_buffer(file_header, mime=True)
+        with self._lock:
+            return self._magic.from_buffer(header)
 
 
 class ZipSignatureDetector(MimeDetectionStrategy):
     """Fallback MIME type detection using ZIP signature"""
     
-    def detect(self, file_stream) -> str:
+    def detect(self, header: bytes) -> str:
         """Detect file type using ZIP signature"""
-        current_pos = file_stream.tell()
-        file_stream.seek(0)
-        header = file_stream.read(4)
-        file_stream.seek(current_pos)
-        
         # Check for ZIP signature (DOCX files are ZIP archives)
-        if header == b'PK\x03\x04':
+        if header.startswith(ZIP_SIGNATURE):
             return 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
         
         return 'unknown'
@@ -69,25 +82,35 @@ class MimeTypeValidator(BaseValidator):
         self.allowed_mime_types = {
             'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
         }
-        self.detector = self._create_detector()
+    
+    @cached_property
+    def detector(self) -> MimeDetectionStrategy:
+        """MIME detector, created on first validation"""
+        return self._create_detector()
     
     def _create_detector(self) -> MimeDetectionStrategy:
         """Create appropriate MIME detector based on availability"""
-        if MAGIC_AVAILABLE:
-            return MagicDetector()
-        else:
-            return ZipSignatureDetector()
+        if _get_magic_module() is not None:
+            try:
+                return MagicDetector()
+            except Exception as e:
+                logger.warning(f"Could not load magic database, using ZIP signature check: {str(e)}")
+        return ZipSignatureDetector()
     
-    def validate(self, file_stream) -> Tuple[bool, str]:
+    def validate(self, inspection: UploadInspection) -> Tuple[bool, str]:
         """Validate file MIME type"""
+        # Anything that is not a ZIP archive cannot be DOCX; skip libmagic
+        if not inspection.header.startswith(ZIP_SIGNATURE):
+            return False, INVALID_FORMAT_MESSAGE
+        
         try:
-            mime_type = self.detector.detect(file_stream)
+            mime_type = self.detector.detect(inspection.header)
             logger.debug(f"Detected MIME type: {mime_type}")
             
             if mime_type in self.allowed_mime_types:
                 return True, ""
             else:
-                return False, "Invalid file format. File does not appear to be a valid DOCX document"
+                return False, INVALID_FORMAT_MESSAGE
                 
         except Exception as e:
             logger.error(f"Error detecting file type: {str(e)}")
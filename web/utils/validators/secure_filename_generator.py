@@ -2,9 +2,9 @@
 Secure filename generation utilities
 """
 
-import os
 import uuid
-from pathlib import Path
+
+DOCX_SUFFIX = '.docx'
 
 
 class SecureFilenameGenerator:
@@ -13,8 +13,7 @@ class SecureFilenameGenerator:
     @staticmethod
     def generate() -> str:
         """Generate a secure UUID-based filename"""
-        secure_name = str(uuid.uuid4())
-        return f"{secure_name}.docx"
+        return uuid.uuid4().hex + DOCX_SUFFIX
     
     @staticmethod
     def sanitize_display_name(filename: str, max_length: int = 255) -> str:
@@ -22,12 +21,17 @@ class SecureFilenameGenerator:
         if not filename:
             return "unnamed_file.docx"
         
-        # Remove path components
-        filename = os.path.basename(filename)
+        # Remove path components (POSIX and Windows separators)
+        filename = filename[filename.rfind('/') + 1:]
+        filename = filename[filename.rfind('\\') + 1:]
         
-        # Limit length
-        if len(filename) > max_length:
-            name, ext = os.path.splitext(filename)
-            filename = name[:max_length-len(ext)] + ext
+        # Common case: already within the length limit
+        if len(filename) <= max_length:
+            return filename
         
-        return filename
\ No newline at end of file
+        # Limit length, keeping the extension
+        dot = filename.rfind('.')
+        if dot <= 0:
+            return filename[:max_length]
+        ext = filename[dot:]
+        return filename[:min(dot, max_length - len(ext))] + ext
\ No newline at end of file
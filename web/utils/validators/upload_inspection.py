@@ -0,0 +1,54 @@
+"""
+Shared upload inspection for the validators
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import BinaryIO, Optional
+from zipfile import ZipFile
+
+# Bytes read once from the start of the upload for signature and MIME checks
+HEADER_SIZE = 4096
+
+
+@dataclass
+class UploadInspection:
+    """Upload facts gathered once and consumed by every validator"""
+    stream: BinaryIO
+    header: bytes
+    size: int
+    _zip_file: Optional[ZipFile] = field(default=None, init=False, repr=False)
+
+    @classmethod
+    def from_stream(cls, stream: BinaryIO, size: Optional[int] = None) -> 'UploadInspection':
+        """Read the header of a seekable stream, and its size unless already known"""
+        if size is None:
+            size = stream.seek(0, os.SEEK_END)
+        stream.seek(0)
+        header = stream.read(HEADER_SIZE)
+        stream.seek(0)
+        return cls(stream=stream, header=header, size=size)
+
+    def zip_file(self) -> ZipFile:
+        """
+        Open the upload as a ZIP archive, parsing the central directory once
+
+        Raises:
+            BadZipFile: If the upload is not a ZIP archive
+        """
+        if self._zip_file is None:
+            self._zip_file = ZipFile(self.stream, 'r')
+        return self._zip_file
+
+    def close(self) -> None:
+        """Release the archive handle and rewind the stream for downstream readers"""
+        if self._zip_file is not None:
+            self._zip_file.close()
+            self._zip_file = None
+        self.stream.seek(0)
+
+    def __enter__(self) -> 'UploadInspection':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
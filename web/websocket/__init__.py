@@ -2,13 +2,7 @@
 WebSocket initialization and configuration for progress tracking
 """
 
-from flask_socketio import SocketIO
-import logging
-
-# Initialize SocketIO instance
-socketio = SocketIO()
-
-logger = logging.getLogger(__name__)
+from .initialization_helper import initialize_websocket, get_websocket_initializer
 
 def init_websocket(app):
     """
@@ -20,30 +14,7 @@ def init_websocket(app):
     Returns:
         SocketIO: Configured SocketIO instance
     """
-    try:
-        # Get CORS origins from app config
-        cors_origins = app.config.get('CORS_ORIGINS', ['http://localhost:3000'])
-        
-        # Initialize SocketIO with the app
-        socketio.init_app(
-            app,
-            cors_allowed_origins=cors_origins,
-            logger=app.config.get('DEBUG', False),
-            engineio_logger=app.config.get('DEBUG', False),
-            ping_timeout=app.config.get('WEBSOCKET_PING_TIMEOUT', 60),
-            ping_interval=app.config.get('WEBSOCKET_PING_INTERVAL', 25)
-        )
-        
-        # Import event handlers to register them
-        from . import progress
-        
-        logger.info(f"WebSocket initialized with CORS origins: {cors_origins}")
-        logger.info("WebSocket event handlers registered")
-        return socketio
-        
-    except Exception as e:
-        logger.error(f"Failed to initialize WebSocket: {str(e)}")
-        raise
+    return initialize_websocket(app)
 
 def get_socketio():
     """
@@ -52,4 +23,4 @@ def get_socketio():
     Returns:
         SocketIO: The configured SocketIO instance
     """
-    return socketio
\ No newline at end of file
+    return get_websocket_initializer().get_socketio()
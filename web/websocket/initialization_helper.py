@@ -4,8 +4,11 @@ Handles ONLY WebSocket setup and configuration
 """
 
 import logging
+from typing import TYPE_CHECKING
 from flask import Flask
-from flask_socketio import SocketIO
+
+if TYPE_CHECKING:
+    from flask_socketio import SocketIO
 
 logger = logging.getLogger(__name__)
 
@@ -21,10 +24,12 @@ class WebSocketInitializer:
     """
     
     def __init__(self):
+        # Deferred so importing the package does not load the SocketIO stack
+        from flask_socketio import SocketIO
         self.socketio = SocketIO()
         logger.info("WebSocketInitializer created")
     
-    def initialize_with_app(self, app: Flask) -> SocketIO:
+    def initialize_with_app(self, app: Flask) -> 'SocketIO':
         """Initialize WebSocket with Flask application"""
         try:
             self._configure_socketio(app)
@@ -48,7 +53,10 @@ class WebSocketInitializer:
             logger=app.config.get('DEBUG', False),
             engineio_logger=app.config.get('DEBUG', False),
             ping_timeout=app.config.get('WEBSOCKET_PING_TIMEOUT', 60),
-            ping_interval=app.config.get('WEBSOCKET_PING_INTERVAL', 25)
+            ping_interval=app.config.get('WEBSOCKET_PING_INTERVAL', 25),
+            # Shared queue fans emits out across worker processes
+            message_queue=app.config.get('WEBSOCKET_MESSAGE_QUEUE'),
+            async_mode=app.config.get('SOCKETIO_ASYNC_MODE')
         )
         
         logger.info(f"SocketIO configured with CORS origins: {cors_origins}")
@@ -58,7 +66,7 @@ class WebSocketInitializer:
         from . import progress  # Import to register handlers
         logger.debug("Progress event handlers imported")
     
-    def get_socketio(self) -> SocketIO:
+    def get_socketio(self) -> 'SocketIO':
         """Get configured SocketIO instance"""
         return self.socketio
 
@@ -74,7 +82,7 @@ def get_websocket_initializer() -> WebSocketInitializer:
     return _initializer
 
 
-def initialize_websocket(app: Flask) -> SocketIO:
+def initialize_websocket(app: Flask) -> 'SocketIO':
     """Initialize WebSocket with Flask app (convenience function)"""
     initializer = get_websocket_initializer()
     return initializer.initialize_with_app(app)
\ No newline at end of file
@@ -3,6 +3,10 @@ WebSocket event handlers for progress tracking
 """
 
 import logging
+import socket
+import threading
+import time
+from collections import deque
 from flask_socketio import emit, join_room, leave_room, disconnect
 from flask import request
 
@@ -14,6 +18,19 @@ socketio = get_socketio()
 progress_tracker = get_progress_tracker()
 logger = logging.getLogger(__name__)
 
+def _disable_nagle():
+    """
+    Set TCP_NODELAY on the client's socket so small progress events are not delayed
+    
+    Only possible when served by eventlet, which exposes the raw socket through
+    the WSGI environ; other servers are left untouched.
+    """
+    try:
+        client_socket = request.environ['eventlet.input'].get_socket()
+        client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except Exception as e:
+        logger.debug(f"Could not set TCP_NODELAY: {str(e)}")
+
 @socketio.on('connect')
 def handle_connect():
     """
@@ -23,6 +40,7 @@ def handle_connect():
     """
     try:
         client_id = request.sid
+        _disable_nagle()
         logger.info(f"Client connected: {client_id}")
         
         # Send connection confirmation
@@ -236,8 +254,16 @@ def handle_ping(data=None):
 # Add the missing _get_current_timestamp method to progress_tracker for consistency
 if not hasattr(progress_tracker, '_get_current_timestamp'):
     from datetime import datetime
+    
+    # Second-resolution ISO string, formatted once per second and reused
+    _timestamp_cache = [None, None]
+    
     def _get_current_timestamp():
-        return datetime.utcnow().isoformat()
+        second = int(time.time())
+        if _timestamp_cache[0] != second:
+            _timestamp_cache[1] = datetime.utcfromtimestamp(second).isoformat()
+            _timestamp_cache[0] = second
+        return _timestamp_cache[1]
     progress_tracker._get_current_timestamp = _get_current_timestamp
 
 # Connection limit handling
@@ -258,6 +284,20 @@ def default_error_handler(e):
 
 # Optional: Rate limiting for connection events
 _connection_attempts = {}
+_connection_attempts_lock = threading.Lock()
+
+# Clients idle for a full window are dropped from _connection_attempts at most this often
+_RATE_LIMIT_SWEEP_INTERVAL = 60.0
+_last_rate_limit_sweep = 0.0
+
+def _sweep_idle_clients(current_time, window_seconds):
+    """Forget clients whose most recent attempt is outside the window (caller holds the lock)"""
+    idle = [
+        client_id for client_id, attempts in _connection_attempts.items()
+        if not attempts or current_time - attempts[-1] >= window_seconds
+    ]
+    for client_id in idle:
+        _connection_attempts.pop(client_id, None)
 
 def check_rate_limit(client_id, max_attempts=10, window_seconds=60):
     """
@@ -271,22 +311,28 @@ def check_rate_limit(client_id, max_attempts=10, window_seconds=60):
     Returns:
         bool: True if within rate limit
     """
-    import time
+    global _last_rate_limit_sweep
     current_time = time.time()
     
-    if client_id not in _connection_attempts:
-        _connection_attempts[client_id] = []
-    
-    # Clean old attempts
-    _connection_attempts[client_id] = [
-        timestamp for timestamp in _connection_attempts[client_id]
-        if current_time - timestamp < window_seconds
-    ]
-    
-    # Check if over limit
-    if len(_connection_attempts[client_id]) >= max_attempts:
-        return False
-    
-    # Add current attempt
-    _connection_attempts[client_id].append(current_time)
-    return True
\ No newline at end of file
+    # Connect handlers run concurrently under threading async mode
+    with _connection_attempts_lock:
+        if current_time - _last_rate_limit_sweep >= _RATE_LIMIT_SWEEP_INTERVAL:
+            _last_rate_limit_sweep = current_time
+            _sweep_idle_clients(current_time, window_seconds)
+        
+        attempts = _connection_attempts.get(client_id)
+        if attempts is None:
+            attempts = _connection_attempts[client_id] = deque()
+        
+        # Attempts are in time order, so expired ones are all at the left end;
+        # the deque never holds more than max_attempts entries
+        while attempts and current_time - attempts[0] >= window_seconds:
+            attempts.popleft()
+        
+        # Check if over limit
+        if len(attempts) >= max_attempts:
+            return False
+        
+        # Add current attempt
+        attempts.append(current_time)
+        return True